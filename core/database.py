@@ -5,7 +5,9 @@ Provides methods for CRUD (Create, Read, Update, Delete) of invoices and custome
 """
 
 import os
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 from typing import List, Tuple, Optional
 
@@ -30,8 +32,85 @@ class Database:
         self.customer_db_file = self.data_dir / "customers.db"
         self.config_path = self.data_dir / "config.json"
 
+        # Per-thread read connections, reopened when the generation changes
+        self._local = threading.local()
+        self._conn_generation = 0
+
+        # Single long-lived thread for background loads, started on first use
+        self._jobs = queue.Queue()
+        self._worker = None
+
         self._create_tables()
 
+    def _read_connection(self) -> sqlite3.Connection:
+        """
+        Returns this thread's long-lived connection to the invoices database.
+
+        Search and report queries run repeatedly with the same SQL text, so
+        keeping the connection open lets sqlite3 reuse their compiled
+        statements instead of parsing them on every call.
+
+        Returns:
+            Open connection owned by the calling thread
+        """
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or local.generation != self._conn_generation:
+            if conn is not None:
+                conn.close()
+            conn = sqlite3.connect(self.db_file, cached_statements=256)
+            local.conn = conn
+            local.generation = self._conn_generation
+        return conn
+
+    def run_in_background(self, results: queue.Queue, tag, func, *args) -> None:
+        """
+        Runs func(*args) on the database's background reader thread.
+
+        Jobs run one at a time on the same thread, so they all share its
+        cached read connection instead of each opening (and leaking) one.
+        When the job ends, (tag, outcome) is put on results: outcome is what
+        func returned, or the exception it raised, so the caller always gets
+        an answer.
+
+        Args:
+            results: Queue the caller drains on its own thread
+            tag: Value returned alongside the outcome (e.g. a request number)
+            func: Callable to run off the Tk thread
+            *args: Positional arguments for func
+        """
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run_jobs, name="database-reader", daemon=True
+            )
+            self._worker.start()
+        self._jobs.put((results, tag, func, args))
+
+    def _run_jobs(self) -> None:
+        """
+        Background reader loop: executes queued jobs for the app's lifetime.
+        """
+        while True:
+            results, tag, func, args = self._jobs.get()
+            try:
+                outcome = func(*args)
+            except Exception as e:
+                outcome = e
+            results.put((tag, outcome))
+
+    def reset_connections(self) -> None:
+        """
+        Discards cached read connections (e.g. after the database file is replaced).
+
+        The calling thread's connection is closed now; other threads reopen
+        theirs on next use.
+        """
+        self._conn_generation += 1
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _create_tables(self) -> None:
         """
         Creates invoice and customer tables if they don't exist.
@@ -53,6 +132,8 @@ class Database:
                     creation_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            self._create_search_index(conn)
+            self._create_report_index(conn)
 
         # Customers table (CORRECTED - removed UNIQUE constraint from CNPJ)
         with sqlite3.connect(self.customer_db_file) as conn:
@@ -70,6 +151,113 @@ class Database:
                 )
             """)
 
+    # Columns mirrored into the full-text index, in the same order as the
+    # invoices_fts definition. Value is indexed with both "." and ","
+    # decimal separators so either form matches.
+    _FTS_SOURCE_COLUMNS = """
+        strftime('%d/%m/%Y', {row}issue_date),
+        {row}number,
+        {row}customer,
+        CAST({row}value AS TEXT) || ' ' || REPLACE(CAST({row}value AS TEXT), '.', ','),
+        COALESCE({row}phone, ''),
+        COALESCE({row}email, ''),
+        COALESCE({row}cnpj, ''),
+        COALESCE({row}address, '')
+    """
+
+    def _create_report_index(self, conn: sqlite3.Connection) -> None:
+        """
+        Creates the covering index used by report and period queries.
+
+        Report pages filter or sort by issue_date and read only id, number,
+        customer and value, so with these columns in the index SQLite answers
+        them (and the COUNT/SUM totals) without touching the table rows.
+        ANALYZE runs once, when the index is first created.
+
+        Args:
+            conn: Open connection to the invoices database
+        """
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_invoices_report'"
+        )
+        if cursor.fetchone() is not None:
+            return
+
+        cursor.execute("""
+            CREATE INDEX idx_invoices_report
+            ON invoices(issue_date, id, number, customer, value)
+        """)
+        cursor.execute("ANALYZE invoices")
+
+    def _create_search_index(self, conn: sqlite3.Connection) -> None:
+        """
+        Creates the FTS5 search index for invoices and its sync triggers.
+
+        Uses the trigram tokenizer so MATCH keeps the substring semantics of
+        the LIKE search. If FTS5/trigram is unavailable in this SQLite build,
+        searches fall back to LIKE.
+
+        Args:
+            conn: Open connection to the invoices database
+        """
+        self.fts_available = False
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'invoices_fts'"
+        )
+        exists = cursor.fetchone() is not None
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS invoices_fts USING fts5(
+                    br_date, number, customer, value,
+                    phone, email, cnpj, address,
+                    tokenize = 'trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return
+
+        new_columns = self._FTS_SOURCE_COLUMNS.format(row="new.")
+        cursor.executescript(f"""
+            CREATE TRIGGER IF NOT EXISTS invoices_fts_insert AFTER INSERT ON invoices
+            BEGIN
+                INSERT INTO invoices_fts (
+                    rowid, br_date, number, customer, value,
+                    phone, email, cnpj, address
+                ) VALUES (new.id, {new_columns});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS invoices_fts_delete AFTER DELETE ON invoices
+            BEGIN
+                DELETE FROM invoices_fts WHERE rowid = old.id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS invoices_fts_update AFTER UPDATE ON invoices
+            BEGIN
+                DELETE FROM invoices_fts WHERE rowid = old.id;
+                INSERT INTO invoices_fts (
+                    rowid, br_date, number, customer, value,
+                    phone, email, cnpj, address
+                ) VALUES (new.id, {new_columns});
+            END;
+        """)
+
+        # Index invoices that existed before the search table was created
+        if not exists:
+            cursor.execute(f"""
+                INSERT INTO invoices_fts (
+                    rowid, br_date, number, customer, value,
+                    phone, email, cnpj, address
+                )
+                SELECT id, {self._FTS_SOURCE_COLUMNS.format(row="")}
+                FROM invoices
+            """)
+
+        self.fts_available = True
+
     # ==============================================
     # INVOICE METHODS
     # ==============================================
@@ -116,7 +304,7 @@ class Database:
         Returns:
             List of tuples with invoice information
         """
-        with sqlite3.connect(self.db_file) as conn:
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT
@@ -165,7 +353,7 @@ class Database:
         Returns:
             List of tuples with invoice information
         """
-        with sqlite3.connect(self.db_file) as conn:
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT
@@ -235,19 +423,88 @@ class Database:
             """)
             return cursor.fetchone()
 
-    def get_invoices_by_customer(self, customer_name: str) -> List[Tuple]:
+    def get_invoices_by_customer(self, customer_name: str, limit: int = -1,
+                                 offset: int = 0) -> List[Tuple]:
         """
-        Returns invoices from a specific customer.
+        Returns invoices whose customer name contains the given text.
 
         Args:
-            customer_name: Customer name to filter
+            customer_name: Customer name (or part of it) to filter, case-insensitive
+            limit: Maximum number of rows (-1 for all)
+            offset: Number of rows to skip
 
         Returns:
             List of tuples with invoice information
         """
-        with sqlite3.connect(self.db_file) as conn:
+        return self.get_invoices_page(
+            "client", offset, limit, customer_name=customer_name
+        )
+
+    def _report_filter(self, kind: str, start: str = "", end: str = "",
+                       customer_name: str = "") -> Tuple[str, tuple]:
+        """
+        Returns the WHERE clause and parameters for a report kind.
+
+        Args:
+            kind: "general", "period" or "client"
+            start: Start date in YYYY-MM-DD format (period)
+            end: End date in YYYY-MM-DD format (period)
+            customer_name: Customer name to filter (client)
+
+        Returns:
+            Tuple with (where_clause, parameters)
+        """
+        if kind == "general":
+            return "", ()
+        if kind == "period":
+            return "WHERE issue_date BETWEEN ? AND ?", (start, end)
+        if kind == "client":
+            # LIKE is case-insensitive for ASCII; '%', '_' and '\' typed by
+            # the user are matched literally
+            escaped = (
+                customer_name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            return "WHERE customer LIKE ? ESCAPE '\\'", (f"%{escaped}%",)
+        raise ValueError(f"Tipo de relatório desconhecido: {kind}")
+
+    def get_invoice_totals(self, kind: str, **params) -> Tuple[int, float]:
+        """
+        Returns invoice count and value sum for a report, aggregated in SQL.
+
+        Args:
+            kind: "general", "period" or "client"
+            **params: Filter parameters (see _report_filter)
+
+        Returns:
+            Tuple with (count, total_value)
+        """
+        where, args = self._report_filter(kind, **params)
+        with self._read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
+            cursor.execute(f"""
+                SELECT COUNT(*), COALESCE(SUM(value), 0)
+                FROM invoices
+                {where}
+            """, args)
+            return cursor.fetchone()
+
+    def get_invoices_page(self, kind: str, offset: int, limit: int, **params) -> List[Tuple]:
+        """
+        Returns one page of invoices for a report.
+
+        Args:
+            kind: "general", "period" or "client"
+            offset: Number of rows to skip
+            limit: Maximum number of rows (-1 for all remaining rows)
+            **params: Filter parameters (see _report_filter)
+
+        Returns:
+            List of tuples with (id, br_date, number, customer, value)
+        """
+        where, args = self._report_filter(kind, **params)
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
                 SELECT
                     id,
                     strftime('%d/%m/%Y', issue_date) AS br_date,
@@ -255,9 +512,41 @@ class Database:
                     customer,
                     value
                 FROM invoices
-                WHERE customer LIKE ?
-                ORDER BY issue_date DESC
-            """, (f"%{customer_name}%",))
+                {where}
+                ORDER BY issue_date DESC, id DESC
+                LIMIT ? OFFSET ?
+            """, args + (limit, offset))
+            return cursor.fetchall()
+
+    def get_invoices_export_rows(self, kind: str, **params) -> List[Tuple]:
+        """
+        Returns every invoice of a report with the columns written to CSV.
+
+        Args:
+            kind: "general", "period" or "client"
+            **params: Filter parameters (see _report_filter)
+
+        Returns:
+            List of tuples with (br_date, number, customer, value, phone,
+            email, cnpj, address)
+        """
+        where, args = self._report_filter(kind, **params)
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT
+                    strftime('%d/%m/%Y', issue_date) AS br_date,
+                    number,
+                    customer,
+                    value,
+                    COALESCE(phone, ''),
+                    COALESCE(email, ''),
+                    COALESCE(cnpj, ''),
+                    COALESCE(address, '')
+                FROM invoices
+                {where}
+                ORDER BY issue_date DESC, id DESC
+            """, args)
             return cursor.fetchall()
 
     def search_invoices_by_term(self, term: str) -> List[Tuple]:
@@ -270,7 +559,7 @@ class Database:
         Returns:
             List of tuples with found invoice information
         """
-        with sqlite3.connect(self.db_file) as conn:
+        with self._read_connection() as conn:
             cursor = conn.cursor()
 
             term_lower = term.lower()
@@ -311,6 +600,45 @@ class Database:
             ))
             return cursor.fetchall()
 
+    def search_invoices_fts(self, term: str) -> List[Tuple]:
+        """
+        Searches invoices by any field containing the term using the FTS5 index.
+
+        Falls back to search_invoices_by_term when the index is unavailable
+        (old SQLite, database restored from an older backup) or when the term
+        is shorter than the 3 characters a trigram needs.
+
+        Args:
+            term: Search term
+
+        Returns:
+            List of tuples with found invoice information
+        """
+        if not self.fts_available or len(term) < 3:
+            return self.search_invoices_by_term(term)
+
+        # Quote as an FTS phrase so user input is never parsed as query syntax
+        phrase = '"' + term.replace('"', '""') + '"'
+
+        try:
+            with self._read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT
+                        i.id,
+                        strftime('%d/%m/%Y', i.issue_date) AS br_date,
+                        i.number,
+                        i.customer,
+                        i.value
+                    FROM invoices_fts f
+                    JOIN invoices i ON i.id = f.rowid
+                    WHERE invoices_fts MATCH ?
+                    ORDER BY i.issue_date DESC
+                """, (phrase,))
+                return cursor.fetchall()
+        except sqlite3.OperationalError:
+            return self.search_invoices_by_term(term)
+
     def update_invoice(self, invoice_id: int, issue_date: str, number: str, customer: str,
                       value: float, phone: str = "", email: str = "", cnpj: str = "",
                       address: str = "") -> bool:
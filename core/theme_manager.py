@@ -37,10 +37,12 @@ class ThemeManager:
 
         # Temas disponíveis
         self.available_themes = self._get_available_themes()
+        self._tree_data = None
         self.current_theme = self.config.get("theme", "darkly")
         self.current_mode = self.config.get("mode", "dark")
 
         # Registrar temas customizados (se houver style)
+        self._custom_registered = False
         if self.style:
             self._register_custom_themes()
 
@@ -212,7 +214,7 @@ class ThemeManager:
 
     def _register_custom_themes(self):
         """Registra temas customizados no ttkbootstrap."""
-        if not self.custom_themes or not self.style:
+        if self._custom_registered or not self.custom_themes or not self.style:
             return
 
         try:
@@ -283,6 +285,9 @@ class ThemeManager:
         except Exception as e:
             print(f"Erro geral ao registrar temas customizados: {e}")
 
+        # Só volta a registrar quando os temas da pasta forem recarregados
+        self._custom_registered = True
+
     def _get_available_themes(self) -> Dict[str, Dict[str, Any]]:
         """
         Retorna todos os temas disponíveis organizados por categoria.
@@ -319,6 +324,14 @@ class ThemeManager:
             },
         }
 
+        # Tipo exibido na árvore de temas, calculado uma vez aqui
+        for category_key, category_data in available_themes.items():
+            for theme in category_data["themes"]:
+                if category_key == "claro" or "light" in theme["name"].lower():
+                    theme["type"] = "Claro"
+                else:
+                    theme["type"] = "Escuro"
+
         # Adicionar temas customizados, se houver
         if self.custom_themes:
             custom_themes_list = []
@@ -331,6 +344,7 @@ class ThemeManager:
                         "name": theme_name,
                         "display": f"{theme_name} ({theme_type_display})",
                         "style": theme_name,
+                        "type": "Customizado",
                     }
                 )
 
@@ -436,16 +450,22 @@ class ThemeManager:
                 theme_list.append((theme["name"], theme["display"]))
         return theme_list
 
-    def get_themes_tree_data(self) -> List[Tuple[str, List[Tuple[str, str]]]]:
+    def get_themes_tree_data(self) -> List[Tuple[str, List[Tuple[str, str, str]]]]:
         """
-        Retorna os temas organizados em árvore por categoria.
+        Retorna os temas organizados em árvore por categoria, como
+        (categoria, [(nome, exibição, tipo), ...]).
+        Calculado uma vez e reaproveitado até os temas serem recarregados.
         """
+        if self._tree_data is not None:
+            return self._tree_data
+
         tree_data = []
         for category_key, category_data in self.available_themes.items():
             themes_list = []
             for theme in category_data["themes"]:
-                themes_list.append((theme["name"], theme["display"]))
+                themes_list.append((theme["name"], theme["display"], theme["type"]))
             tree_data.append((category_data["name"], themes_list))
+        self._tree_data = tree_data
         return tree_data
 
     def apply_theme(self, theme_name: str, window=None) -> bool:
@@ -543,8 +563,10 @@ class ThemeManager:
         Recarrega os temas customizados da pasta.
         """
         self.custom_themes = self._load_custom_themes()
+        self._custom_registered = False
         self._register_custom_themes()
         self.available_themes = self._get_available_themes()
+        self._tree_data = None
 
     def get_custom_themes_dir(self) -> Path:
         """
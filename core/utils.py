@@ -9,6 +9,9 @@ import tkinter as tk
 from datetime import datetime
 from typing import Optional, Union
 
+# Swaps Python's "1,234.56" separators for the Brazilian "1.234,56"
+_BR_SEPARATORS = str.maketrans(",.", ".,")
+
 
 def format_currency(value: Union[str, float, int], with_symbol: bool = True) -> str:
     """Formats monetary value to Brazilian format."""
@@ -46,16 +49,12 @@ def format_currency(value: Union[str, float, int], with_symbol: bool = True) ->
             
             value_float = float(value_str)
 
-        # Formata para o padrão brasileiro
-        value_str_formatted = f"{value_float:,.2f}"
-        
-        # Substitui as formatações padrão do Python pelo padrão brasileiro
-        parts = value_str_formatted.split(".")
-        integer_part = parts[0].replace(",", "X").replace(".", ",").replace("X", ".")
-        decimal_part = parts[1] if len(parts) > 1 else "00"
-        
-        formatted = f"{integer_part},{decimal_part}"
-        
+        # Formata para o padrão brasileiro, trocando os separadores de uma vez
+        formatted = f"{value_float:,.2f}".translate(_BR_SEPARATORS)
+        if "," not in formatted:
+            # nan/inf não têm parte decimal
+            formatted += ",00"
+
         return f"R$ {formatted}" if with_symbol else formatted
 
     except (ValueError, TypeError):
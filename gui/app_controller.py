@@ -30,6 +30,8 @@ class AppController:
         self.theme_manager = theme_manager
         self.database = database
         self.current_view = None
+        # Event listeners: event key -> list of callbacks
+        self._listeners = {}
 
         # Configure close protocol
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -102,7 +104,25 @@ class AppController:
         elif event == EventKeys.THEME:
             self.show_theme()
 
+    def register_listener(self, event, callback):
+        """Registers a callback to be notified when the event is broadcast."""
+        self._listeners.setdefault(event, []).append(callback)
+
+    def unregister_listener(self, event, callback):
+        """Removes a callback previously registered for the event."""
+        callbacks = self._listeners.get(event, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def notify_listeners(self, event, data=None):
+        """Broadcasts an event to all registered listeners."""
+        for callback in list(self._listeners.get(event, [])):
+            callback(data)
+
     def refresh_current_view(self):
         """Requests current view to refresh its data."""
+        # Data may have been replaced (e.g. backup restore)
+        self.notify_listeners(EventKeys.INVOICE_CHANGED)
+        self.notify_listeners(EventKeys.CUSTOMER_CHANGED)
         if self.current_view and hasattr(self.current_view, "refresh_data"):
             self.current_view.refresh_data()
\ No newline at end of file
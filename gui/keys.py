@@ -28,5 +28,7 @@ class EventKeys:
 
     # Data control
     DATA_CHANGED = "data_changed"
+    INVOICE_CHANGED = "invoice_changed"
+    CUSTOMER_CHANGED = "customer_changed"
     RELOAD = "reload"
     REFRESH = "refresh"
\ No newline at end of file
@@ -214,7 +214,9 @@ Arquivos incluídos:
                         zipf.extractall(temp_dir)
 
                     # CORREÇÃO: Removido o backup automático dos arquivos atuais
-                    # Substituir diretamente os arquivos atuais
+                    # Substituir diretamente os arquivos atuais (fechando antes as
+                    # conexões de leitura mantidas abertas pelo banco)
+                    self.database.reset_connections()
                     shutil.copy2(temp_dir / "invoices.db", self.invoices_db_path)
                     shutil.copy2(temp_dir / "customers.db", self.customers_db_path)
 
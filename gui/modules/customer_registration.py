@@ -487,6 +487,7 @@ class CustomerRegistration(tb.Frame):
 
         dialog.destroy()
         show_info(self.winfo_toplevel(), f"{len(selected_ids)} cliente(s) excluído(s) com sucesso!")
+        self.controller.notify_listeners(EventKeys.CUSTOMER_CHANGED)
         self.refresh_data()
 
     def _confirm_and_delete_all(self, dialog):
@@ -506,6 +507,7 @@ class CustomerRegistration(tb.Frame):
 
             dialog.destroy()
             show_info(self.winfo_toplevel(), f"Todas as {total} cliente(s) foram excluídas com sucesso!")
+            self.controller.notify_listeners(EventKeys.CUSTOMER_CHANGED)
             self.refresh_data()
 
     def save_customer(self):
@@ -550,6 +552,7 @@ class CustomerRegistration(tb.Frame):
                 else:
                     show_error(self.winfo_toplevel(), "Já existe um cliente com este nome!")
 
+            self.controller.notify_listeners(EventKeys.CUSTOMER_CHANGED)
             self.refresh_data()
         except Exception as e:
             show_error(self.winfo_toplevel(), f"Erro ao salvar cliente: {str(e)}")
@@ -99,11 +99,14 @@ class InvoiceDelete(ttk.Frame):
             for invoice_id in selected_ids:
                 self.database.delete_invoice(invoice_id)
         except Exception as e:
+            # Notes deleted before the error are gone as well
+            self.controller.notify_listeners(EventKeys.INVOICE_CHANGED)
             show_error(self.parent, f"Erro ao excluir notas: {e}")
             dialog.destroy()
             return
 
         dialog.destroy()
+        self.controller.notify_listeners(EventKeys.INVOICE_CHANGED)
         show_info(self.parent, f"{len(selected_ids)} nota(s) excluída(s) com sucesso!")
         self._refresh_view()
 
@@ -127,6 +130,7 @@ class InvoiceDelete(ttk.Frame):
                 return
 
             dialog.destroy()
+            self.controller.notify_listeners(EventKeys.INVOICE_CHANGED)
             show_info(self.parent, f"Todas as {total} nota(s) foram excluídas com sucesso!")
             self._refresh_view()
 
@@ -4,11 +4,13 @@ Interface for exporting invoices to CSV using ttkbootstrap.
 Works as modal dialog with export options.
 """
 
+import csv
 import os
 import platform
 import subprocess
 import tkinter as tk
 from datetime import datetime
+from functools import lru_cache
 import traceback
 
 import ttkbootstrap as tb
@@ -20,6 +22,22 @@ from ..utils.tooltips import create_info_tooltip
 from core.utils import format_currency
 
 
+# CSV column titles, in export order
+_CSV_HEADER = (
+    "Data Emissao", "Numero", "Cliente", "Valor",
+    "Telefone", "Email", "CNPJ", "Endereço",
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_csv_value(value):
+    """Formats a value as Brazilian currency text without symbol (1.234,56).
+
+    Cached: exports repeat the same amounts across many rows.
+    """
+    return format_currency(value, with_symbol=False)
+
+
 class InvoiceExport(tb.Frame):
     """Manages exporting invoices to CSV."""
 
@@ -108,84 +126,49 @@ class InvoiceExport(tb.Frame):
     def _export_all_confirm(self, dialog):
         """Exports all system invoices."""
         dialog.destroy()
-        all_invoices = self.database.get_all_invoices()
-        ids = [n[0] for n in all_invoices]
-        self.export_invoices(ids, "todas")
+        self.export_invoice_rows(self.database.get_invoices_export_rows("general"), "todas")
 
     def export_invoices(self, invoice_ids, export_type):
         """Exports invoices to CSV file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_filename = f"notas_{export_type}_{timestamp}.csv"
-
-        try:
-            file_path = asksaveasfilename(
-                parent=self.parent,
-                title="Salvar CSV",
-                initialfile=default_filename,
-                filetypes=[("Arquivos CSV", "*.csv")],
-            )
-        except Exception as e:
-            show_error(self.parent, f"Erro ao abrir diálogo de salvar: {str(e)}")
-            return
-
+        rows = (self.database.get_invoice_by_id(invoice_id) for invoice_id in invoice_ids)
+        self.export_invoice_rows((row for row in rows if row), export_type)
+
+    def export_invoice_rows(self, rows, export_type):
+        """Exports already fetched invoice rows to a CSV file.
+
+        Args:
+            rows: Iterable of (date, number, customer, value, phone, email,
+                cnpj, address) tuples, written as they are consumed
+            export_type: Suffix used in the suggested file name
+        """
+        file_path = self._ask_export_path(export_type)
         if not file_path:
             return
 
-        if not file_path.lower().endswith(".csv"):
-            file_path = f"{file_path}.csv"
-
         try:
-            with open(file_path, "w", encoding="utf-8", newline="") as f:
+            total = 0
+            # 1 MB buffer: large exports reach the disk in few writes
+            with open(file_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
                 # ALTERAÇÃO: Usar ponto e vírgula como separador
-                f.write("Data Emissao;Numero;Cliente;Valor;Telefone;Email;CNPJ;Endereço\n")
-
-                for invoice_id in invoice_ids:
-                    invoice = self.database.get_invoice_by_id(invoice_id)
-                    if not invoice:
-                        continue
-                    
-                    date, number, customer, value, phone, email, cnpj, address = invoice
-                    
-                    # CORREÇÃO: Garantir formatação sempre com duas casas decimais
-                    # Converter para float primeiro
-                    if isinstance(value, (int, float)):
-                        value_float = float(value)
-                    else:
-                        # Se for string, limpar e converter
-                        value_clean = str(value).replace('R$', '').replace('.', '').replace(',', '.').strip()
-                        value_float = float(value_clean) if value_clean else 0.0
-                    
-                    # Formatar com SEMPRE duas casas decimais
-                    # Primeiro formatar como float com 2 casas
-                    value_str = f"{value_float:.2f}"
-                    # Substituir ponto por vírgula para formato brasileiro
-                    value_str = value_str.replace('.', ',')
-                    # Adicionar separadores de milhar se necessário
-                    parts = value_str.split(',')
-                    integer_part = parts[0]
-                    decimal_part = parts[1] if len(parts) > 1 else "00"
-                    
-                    # Adicionar separadores de milhar
-                    if len(integer_part) > 3:
-                        integer_part = f"{int(integer_part):,}".replace(",", ".")
-                    
-                    value_formatted = f"{integer_part},{decimal_part}"
-                    
+                # Plain "\n" line endings as before; fields are quoted only
+                # when they contain ';', quotes or line breaks
+                writer = csv.writer(
+                    f, delimiter=";", quoting=csv.QUOTE_MINIMAL, lineterminator="\n"
+                )
+                writer.writerow(_CSV_HEADER)
+                for date, number, customer, value, phone, email, cnpj, address in rows:
                     # Garantir que campos vazios sejam exportados como string vazia
-                    phone = phone or ""
-                    email = email or ""
-                    cnpj = cnpj or ""
-                    address = address or ""
-                    
-                    # ALTERAÇÃO: Usar ponto e vírgula como separador
-                    line = f'{date};{number};"{customer}";"{value_formatted}";"{phone}";"{email}";"{cnpj}";"{address}"\n'
-                    f.write(line)
+                    writer.writerow((
+                        date, number, customer, _format_csv_value(value),
+                        phone or "", email or "", cnpj or "", address or "",
+                    ))
+                    total += 1
 
             show_info(
                 self.parent, 
                 f"Exportação concluída!\n\n"
                 f"Arquivo salvo em:\n{file_path}\n\n"
-                f"Total de notas exportadas: {len(invoice_ids)}"
+                f"Total de notas exportadas: {total}"
             )
 
             open_file = ask_yes_no(
@@ -198,6 +181,29 @@ class InvoiceExport(tb.Frame):
         except Exception as e:
             show_error(self.parent, f"Erro ao exportar arquivo: {str(e)}")
 
+    def _ask_export_path(self, export_type):
+        """Asks where to save the CSV; returns the path or None if cancelled."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_filename = f"notas_{export_type}_{timestamp}.csv"
+
+        try:
+            file_path = asksaveasfilename(
+                parent=self.parent,
+                title="Salvar CSV",
+                initialfile=default_filename,
+                filetypes=[("Arquivos CSV", "*.csv")],
+            )
+        except Exception as e:
+            show_error(self.parent, f"Erro ao abrir diálogo de salvar: {str(e)}")
+            return None
+
+        if not file_path:
+            return None
+
+        if not file_path.lower().endswith(".csv"):
+            file_path = f"{file_path}.csv"
+        return file_path
+
     def open_file_in_system(self, file_path):
         """Opens file in system's default application."""
         try:
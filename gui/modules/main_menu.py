@@ -4,12 +4,17 @@ Main system interface - grid modularized version.
 Agora usa funções centralizadas do utils.py para formatação.
 """
 
+import queue
+import time
 import tkinter as tk
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from ttkbootstrap.widgets import DateEntry
+from contextlib import contextmanager
 from datetime import datetime
 from functools import partial
+from operator import itemgetter
+from core import utils
 from ..keys import EventKeys
 from ..utils.popups import show_error, show_info, show_warning
 from ..utils import create_info_tooltip, create_success_tooltip
@@ -21,9 +26,62 @@ from ..modules.invoice_export import InvoiceExport
 from ..modules.backup import ConfigBackup
 
 
+# Invoice data keys and the form variable each one is read from
+_SAVE_FIELDS = (
+    ("date", "date_var"),
+    ("number", "number_var"),
+    ("customer", "customer_var"),
+    ("value", "value_var"),
+    ("phone", "phone_var"),
+    ("email", "email_var"),
+    ("cnpj", "cnpj_var"),
+    ("address", "address_var"),
+)
+
+# Seconds the customer combobox list is reused before hitting the database
+_CUSTOMERS_CACHE_TTL = 30
+
+# Typing pause (ms) after which the search query runs
+_SEARCH_DEBOUNCE_MS = 200
+
+# Interval (ms) at which a pending background refresh is checked for
+_REFRESH_POLL_MS = 50
+
+
 class MainMenu(ttk.Frame):
     """Main modularized view using grid."""
 
+    # Action buttons, line 1: (key, text, style, handler, tooltip)
+    _BTN1_SPEC = (
+        ("btn_save", "Salvar Nota", SUCCESS, "save_invoice",
+         "Salvar nota fiscal no sistema."),
+        ("btn_edit", "Editar Nota", WARNING, "edit_invoice",
+         "Carregar nota selecionada para edição."),
+        ("btn_delete", "Excluir", DANGER, "handle_delete_notes",
+         "Excluir notas selecionadas."),
+        ("btn_export", "Exportar", PRIMARY, "handle_export_notes",
+         "Exportar notas selecionadas para CSV."),
+        ("btn_clear_fields", "Limpar Campos", "OUTLINE-WARNING", "clear_fields",
+         "Limpar campos do formulário."),
+    )
+
+    # Navigation buttons, line 2: (text, style, handler, event, tooltip)
+    # When handler is None the event is dispatched to the controller.
+    _BTN2_SPEC = (
+        ("Cadastros", INFO, None, EventKeys.CUSTOMER_REGISTRATION,
+         "Gerenciar cadastro de clientes."),
+        ("Relatório", SECONDARY, None, EventKeys.REPORT,
+         "Gerar relatório completo."),
+        ("Backup", LIGHT, "handle_backup", None,
+         "Gerencia backups das notas."),
+        ("Tema", "SUCCESS-OUTLINE", None, EventKeys.THEME,
+         "Altera o tema da interface."),
+        ("Sobre", "INFO-OUTLINE", "show_about", None,
+         "Sobre este projeto."),
+        ("Sair", DARK, None, EventKeys.EXIT,
+         "Sair do aplicativo."),
+    )
+
     def __init__(self, parent, controller, theme_manager, database):
         super().__init__(parent)
         self.controller = controller
@@ -43,16 +101,54 @@ class MainMenu(ttk.Frame):
         self.edit_mode = False
         self.variables = self.add_manager.initialize_variables()  # dict of StringVar
         self.buttons = {}
+        # Last state applied to each button by update_button_states
+        self._btn_state = {
+            "btn_delete": None,
+            "btn_export": None,
+            "btn_edit": None,
+            "edit_mode": None,
+            "btn_clear_fields": None,
+        }
 
         # Search bar variable and widget (local implementation to avoid focus issues)
         self.search_var = tk.StringVar()
         self.search_entry = None  # created in create_search_bar
         self.btn_search_clear = None
+        # IDs of the rows currently shown by on_search (None = unknown)
+        self._last_filter_signature = None
+        # Pending debounced on_search call
+        self._search_after_id = None
+        # Local search fallback: (all_data list, its lowercased row haystacks)
+        # and (term, matching row indexes) of the previous fallback search
+        self._haystack_cache = (None, [])
+        self._last_local_match = ("", None)
         
         # Customer combobox (functionality absorbed from SearchManager)
         self.customer_combobox = None
+        # Customer names shown in the combobox and full rows keyed by name;
+        # reloaded after _CUSTOMERS_CACHE_TTL or on CUSTOMER_CHANGED
+        self._customers_cache = None
+        self._customers_by_name = {}
+        self._customers_cache_stamp = 0.0
+        controller.register_listener(
+            EventKeys.CUSTOMER_CHANGED, self.invalidate_customers_cache
+        )
+
+        # When True, form field traces skip the 'Clear Fields' recompute
+        self._field_traces_suspended = False
+        # One bit per non-date form field, set while the field has text
+        self._field_bits = 0
+        # An idle _do_state_refresh is already scheduled
+        self._state_refresh_pending = False
+
+        # Background refresh: results of worker fetches, tagged with the
+        # generation of the refresh_data call that started them
+        self._refresh_queue = queue.Queue()
+        self._refresh_generation = 0
+        self._refresh_after_id = None
 
         self.setup_ui()
+        self._freeze_layout()
         self._attach_traces()
         self.refresh_data()
 
@@ -84,15 +180,51 @@ class MainMenu(ttk.Frame):
         self.create_form()
         self.create_buttons()
 
+    def _freeze_layout(self):
+        """Fixes container sizes so content updates don't re-measure the grid.
+
+        Each frame keeps the size it requested right after setup_ui; sticky
+        options still stretch it with the window. Without this, every table
+        repopulation or label change propagates a new requested size up
+        through the nested grids.
+        """
+        self.update_idletasks()
+        for frame in (self.main_container, self._last_invoice_inner, self._form_inner):
+            frame.configure(width=frame.winfo_reqwidth(), height=frame.winfo_reqheight())
+            frame.grid_propagate(False)
+
     def _attach_traces(self):
         """Attaches traces to keep 'clear' button states updated."""
         # Trace for search clear button
         self.search_var.trace_add("write", lambda *a: self.update_search_clear_state())
 
-        # Traces for form fields -> enable/disable "Clear Fields" button
-        # use v=var in lambda to avoid late binding
-        for name, var in self.variables.items():
-            var.trace_add("write", lambda *a, v=var: self.update_clear_fields_button_state())
+        # Traces for form fields -> enable/disable "Clear Fields" button.
+        # Date is ignored, as date_var is usually automatically filled.
+        # use v=var/bit=... in lambda to avoid late binding
+        fields = [var for name, var in self.variables.items() if name != "date_var"]
+        for i, var in enumerate(fields):
+            var.trace_add(
+                "write", lambda *a, v=var, bit=1 << i: self._on_field_write(v, bit)
+            )
+
+    def _on_field_write(self, var, bit):
+        """Form field trace: updates the field's bit and the 'Clear Fields' state."""
+        if (var.get() or "").strip():
+            self._field_bits |= bit
+        else:
+            self._field_bits &= ~bit
+        if not self._field_traces_suspended:
+            self.update_clear_fields_button_state()
+
+    @contextmanager
+    def _suspended_field_traces(self):
+        """Batches several field writes into a single 'Clear Fields' state update."""
+        self._field_traces_suspended = True
+        try:
+            yield
+        finally:
+            self._field_traces_suspended = False
+            self.update_clear_fields_button_state()
 
     def create_title(self):
         """Creates the page title."""
@@ -126,8 +258,8 @@ class MainMenu(ttk.Frame):
             search_frame, textvariable=self.search_var, width=50
         )
         self.search_entry.grid(row=0, column=1, sticky="ew")
-        # KeyRelease to update table while typing
-        self.search_entry.bind("<KeyRelease>", self.on_search)
+        # KeyRelease to update table once typing pauses
+        self.search_entry.bind("<KeyRelease>", self._schedule_search)
         # Ensure initial focus on entry
         try:
             self.search_entry.focus_set()
@@ -163,6 +295,7 @@ class MainMenu(ttk.Frame):
 
         inner_frame = ttk.Frame(self.last_invoice_frame, padding=10)
         inner_frame.grid(row=0, column=0, sticky="ew")
+        self._last_invoice_inner = inner_frame
 
         for i in range(4):
             inner_frame.columnconfigure(i, weight=1)
@@ -210,13 +343,26 @@ class MainMenu(ttk.Frame):
 
     def load_customers(self):
         """Loads the customer list into the combobox (functionality absorbed from SearchManager)."""
+        if (
+            self._customers_cache is not None
+            and time.monotonic() - self._customers_cache_stamp < _CUSTOMERS_CACHE_TTL
+        ):
+            self.customer_combobox["values"] = self._customers_cache
+            return
         try:
             customers = self.database.get_all_customers()
-            customer_names = [customer[1] for customer in customers]
-            self.customer_combobox["values"] = customer_names
+            self._customers_by_name = {customer[1]: customer for customer in customers}
+            self._customers_cache = [customer[1] for customer in customers]
+            self._customers_cache_stamp = time.monotonic()
+            self.customer_combobox["values"] = self._customers_cache
         except Exception as e:
             print(f"Error loading customers: {e}")
 
+    def invalidate_customers_cache(self, data=None):
+        """Forces the next load_customers call to query the database."""
+        self._customers_cache = None
+        self._customers_by_name = {}
+
     def on_customer_selected(self, event):
         """Fills the fields when a customer is selected (functionality absorbed from SearchManager)."""
         customer_name = self.customer_combobox.get()
@@ -224,31 +370,35 @@ class MainMenu(ttk.Frame):
             return
 
         try:
-            customer = self.database.get_customer_by_name(customer_name)
+            customer = self._customers_by_name.get(customer_name)
+            if customer is None:
+                customer = self.database.get_customer_by_name(customer_name)
             if customer:
                 _, name, phone, email, cnpj, address = customer
                 # CORREÇÃO: Usar os nomes corretos das variáveis em inglês
-                self.variables["customer_var"].set(name or "")
-                self.variables["phone_var"].set(phone or "")
-                self.variables["email_var"].set(email or "")
-                self.variables["cnpj_var"].set(cnpj or "")
-                self.variables["address_var"].set(address or "")
+                with self._suspended_field_traces():
+                    self.variables["customer_var"].set(name or "")
+                    self.variables["phone_var"].set(phone or "")
+                    self.variables["email_var"].set(email or "")
+                    self.variables["cnpj_var"].set(cnpj or "")
+                    self.variables["address_var"].set(address or "")
                 show_info(self, f"Dados do cliente '{name}' carregados com sucesso!")
         except Exception as e:
             show_error(self, f"Erro ao carregar dados do cliente: {e}")
 
     def clear_customer_selection(self):
         """Clears the customer selection (functionality absorbed from SearchManager)."""
-        self.customer_combobox.set("")
-        # CORREÇÃO: Usar os nomes corretos das variáveis em inglês
-        for field in [
-            "customer_var",
-            "phone_var",
-            "email_var",
-            "cnpj_var",
-            "address_var",
-        ]:
-            self.variables[field].set("")
+        with self._suspended_field_traces():
+            self.customer_combobox.set("")
+            # CORREÇÃO: Usar os nomes corretos das variáveis em inglês
+            for field in [
+                "customer_var",
+                "phone_var",
+                "email_var",
+                "cnpj_var",
+                "address_var",
+            ]:
+                self.variables[field].set("")
         show_info(self, "Seleção de cliente limpa.")
 
     def create_form(self):
@@ -261,6 +411,7 @@ class MainMenu(ttk.Frame):
 
         inner_frame = ttk.Frame(form_frame, padding=10)
         inner_frame.grid(row=0, column=0, sticky="ew")
+        self._form_inner = inner_frame
 
         for i in range(4):
             inner_frame.columnconfigure(i, weight=1 if i in [1, 3] else 0)
@@ -269,8 +420,6 @@ class MainMenu(ttk.Frame):
 
     def create_form_fields(self, parent):
         """Creates the form fields."""
-        from core import utils
-
         # Emission Date
         ttk.Label(parent, text="Data Emissão*:").grid(
             row=0, column=0, sticky=E, pady=5, padx=(0, 5)
@@ -297,12 +446,6 @@ class MainMenu(ttk.Frame):
         )
         entry_phone = ttk.Entry(parent, textvariable=self.variables["phone_var"])
         entry_phone.grid(row=0, column=3, sticky=EW, pady=5)
-        entry_phone.bind(
-            "<KeyRelease>",
-            lambda e: utils.format_with_cursor_reposition(
-                self.variables["phone_var"], utils.format_phone, e
-            ),
-        )
 
         # Number
         ttk.Label(parent, text="Número*:").grid(
@@ -310,12 +453,6 @@ class MainMenu(ttk.Frame):
         )
         entry_number = ttk.Entry(parent, textvariable=self.variables["number_var"])
         entry_number.grid(row=1, column=1, sticky=EW, pady=5, padx=(0, 10))
-        entry_number.bind(
-            "<KeyRelease>",
-            lambda e: self.add_manager.validate_invoice_number_wrapper(
-                self.variables["number_var"]
-            ),
-        )
 
         # Email
         ttk.Label(parent, text="Email:").grid(
@@ -343,12 +480,6 @@ class MainMenu(ttk.Frame):
         )
         entry_cnpj = ttk.Entry(parent, textvariable=self.variables["cnpj_var"])
         entry_cnpj.grid(row=2, column=3, sticky=EW, pady=5)
-        entry_cnpj.bind(
-            "<KeyRelease>",
-            lambda e: utils.format_with_cursor_reposition(
-                self.variables["cnpj_var"], utils.format_cnpj, e
-            ),
-        )
 
         # Value
         ttk.Label(parent, text="Valor (R$)*:").grid(
@@ -356,12 +487,6 @@ class MainMenu(ttk.Frame):
         )
         entry_value = ttk.Entry(parent, textvariable=self.variables["value_var"])
         entry_value.grid(row=3, column=1, sticky=EW, pady=5, padx=(0, 10))
-        entry_value.bind(
-            "<KeyRelease>",
-            lambda e: utils.format_with_cursor_reposition(
-                self.variables["value_var"], utils.format_typing_value, e
-            ),
-        )
 
         # Address
         ttk.Label(parent, text="Endereço:").grid(
@@ -370,6 +495,43 @@ class MainMenu(ttk.Frame):
         entry_address = ttk.Entry(parent, textvariable=self.variables["address_var"])
         entry_address.grid(row=3, column=3, sticky=EW, pady=5)
 
+        # Typing formatters: a single <KeyRelease> handler on the parent
+        # dispatches by widget instead of one closure bound per entry
+        self._key_handlers = {
+            str(entry_phone): partial(
+                utils.format_with_cursor_reposition,
+                self.variables["phone_var"],
+                utils.format_phone,
+            ),
+            str(entry_number): partial(
+                self.add_manager.validate_invoice_number_wrapper,
+                self.variables["number_var"],
+            ),
+            str(entry_cnpj): partial(
+                utils.format_with_cursor_reposition,
+                self.variables["cnpj_var"],
+                utils.format_cnpj,
+            ),
+            str(entry_value): partial(
+                utils.format_with_cursor_reposition,
+                self.variables["value_var"],
+                utils.format_typing_value,
+            ),
+        }
+        # Key events don't propagate to the parent frame by default; add its
+        # tag to each entry's bindtags right after the widget's own tag
+        parent_tag = str(parent)
+        for entry in (entry_phone, entry_number, entry_cnpj, entry_value):
+            tags = entry.bindtags()
+            entry.bindtags(tags[:1] + (parent_tag,) + tags[1:])
+        parent.bind("<KeyRelease>", self._dispatch_keyrelease)
+
+    def _dispatch_keyrelease(self, event):
+        """Routes <KeyRelease> from form entries to their field formatter."""
+        handler = self._key_handlers.get(str(event.widget))
+        if handler is not None:
+            handler(event)
+
     def create_buttons(self):
         """Creates the action buttons."""
         button_frame = ttk.Frame(self.main_container)
@@ -384,42 +546,13 @@ class MainMenu(ttk.Frame):
         line1_inner = ttk.Frame(line1)
         line1_inner.grid(row=0, column=0)
 
-        buttons_line1 = [
-            (
-                "Salvar Nota",
-                SUCCESS,
-                self.save_invoice,
-                "Salvar nota fiscal no sistema.",
-            ),
-            (
-                "Editar Nota",
-                WARNING,
-                self.edit_invoice,
-                "Carregar nota selecionada para edição.",
-            ),
-            (
-                "Excluir",
-                DANGER,
-                self.handle_delete_notes,
-                "Excluir notas selecionadas.",
-            ),
-            (
-                "Exportar",
-                PRIMARY,
-                self.handle_export_notes,
-                "Exportar notas selecionadas para CSV.",
-            ),
-            (
-                "Limpar Campos",
-                "OUTLINE-WARNING",
-                self.clear_fields,
-                "Limpar campos do formulário.",
-            ),
-        ]
-
-        for i, (text, style, command, tooltip) in enumerate(buttons_line1):
+        for i, (key, text, style, handler, tooltip) in enumerate(self._BTN1_SPEC):
             btn = ttk.Button(
-                line1_inner, text=text, command=command, bootstyle=style, width=15
+                line1_inner,
+                text=text,
+                command=getattr(self, handler),
+                bootstyle=style,
+                width=15,
             )
             btn.grid(row=0, column=i, padx=5)
 
@@ -429,19 +562,11 @@ class MainMenu(ttk.Frame):
                 create_info_tooltip(btn, tooltip)
 
             # Store references to important buttons
-            if text == "Salvar Nota":
-                self.buttons["btn_save"] = btn
-            elif text == "Editar Nota":
-                self.buttons["btn_edit"] = btn
-            elif text == "Excluir":
-                self.buttons["btn_delete"] = btn
-            elif text == "Exportar":
-                self.buttons["btn_export"] = btn
-            elif text == "Limpar Campos":
-                # store reference to control state
-                self.buttons["btn_clear_fields"] = btn
-                # start disabled (empty)
-                btn.config(state=DISABLED)
+            self.buttons[key] = btn
+
+        # "Limpar Campos" starts disabled (empty form)
+        self.buttons["btn_clear_fields"].config(state=DISABLED)
+        self._btn_state["btn_clear_fields"] = DISABLED
 
         # Line 2
         line2 = ttk.Frame(button_frame)
@@ -451,41 +576,11 @@ class MainMenu(ttk.Frame):
         line2_inner = ttk.Frame(line2)
         line2_inner.grid(row=0, column=0)
 
-        buttons_line2 = [
-            (
-                "Cadastros",
-                INFO,
-                lambda: self.controller.handle_event(EventKeys.CUSTOMER_REGISTRATION),
-                "Gerenciar cadastro de clientes.",
-            ),
-            (
-                "Relatório",
-                SECONDARY,
-                lambda: self.controller.handle_event(EventKeys.REPORT),
-                "Gerar relatório completo.",
-            ),
-            ("Backup", LIGHT, self.handle_backup, "Gerencia backups das notas."),
-            (
-                "Tema",
-                "SUCCESS-OUTLINE",
-                lambda: self.controller.handle_event(EventKeys.THEME),
-                "Altera o tema da interface.",
-            ),
-            (
-                "Sobre",
-                "INFO-OUTLINE",
-                self.show_about,
-                "Sobre este projeto.",
-            ),
-            (
-                "Sair",
-                DARK,
-                lambda: self.controller.handle_event(EventKeys.EXIT),
-                "Sair do aplicativo.",
-            ),
-        ]
-
-        for i, (text, style, command, tooltip) in enumerate(buttons_line2):
+        for i, (text, style, handler, event, tooltip) in enumerate(self._BTN2_SPEC):
+            if handler:
+                command = getattr(self, handler)
+            else:
+                command = partial(self.controller.handle_event, event)
             btn = ttk.Button(
                 line2_inner, text=text, command=command, bootstyle=style, width=12
             )
@@ -509,28 +604,24 @@ class MainMenu(ttk.Frame):
         if btn is None:
             return
 
-        # Ignore date, as date_var is usually automatically filled
-        fields_to_check = [
-            k for k in self.variables.keys() if k != "date_var"  # CORREÇÃO: date_var
-        ]
-
-        any_filled = any(
-            (self.variables[k].get() or "").strip() for k in fields_to_check
-        )
-
-        state = NORMAL if any_filled else DISABLED
+        # _field_bits is kept current by the field traces
+        state = NORMAL if self._field_bits else DISABLED
+        if self._btn_state["btn_clear_fields"] == state:
+            return
         try:
             btn.config(state=state)
+            self._btn_state["btn_clear_fields"] = state
         except Exception:
-            pass    
+            pass
 
     def update_last_invoice(self):
         """Updates the frame with the last invoice data."""
-        last_invoice = self.database.get_last_invoice()
+        self._show_last_invoice(self.database.get_last_invoice())
 
+    def _show_last_invoice(self, last_invoice):
+        """Fills the last invoice labels from (date, number, customer, value) or None."""
         if last_invoice:
             emission_date, number, customer, value = last_invoice
-            from core import utils  # Import here to avoid circular imports
 
             self.last_invoice_labels["date"].config(text=f"Data: {emission_date}")
             self.last_invoice_labels["number"].config(text=f"Número: {number}")
@@ -550,28 +641,30 @@ class MainMenu(ttk.Frame):
         term = (self.search_var.get() or "").strip()
 
         # Local filtering (functionality absorbed from SearchManager)
+        # FTS rows have fewer columns than all_data rows, so the source is
+        # part of the redraw signature along with the row IDs
+        source = "all"
         try:
             if term:
                 # Try to use database method first
-                result = self.database.search_invoices_by_term(term)
+                result = self.database.search_invoices_fts(term)
                 self.table_manager.filtered_data = result
+                source = "fts"
             else:
                 self.table_manager.filtered_data = self.table_manager.all_data.copy()
         except Exception:
             # Fallback to local filtering
             if term:
-                lower = term.lower()
-                filtered = [
-                    row
-                    for row in self.table_manager.all_data
-                    if any(lower in (str(col) or "").lower() for col in row)
-                ]
-                self.table_manager.filtered_data = filtered
+                self.table_manager.filtered_data = self._filter_local(term.lower())
             else:
                 self.table_manager.filtered_data = self.table_manager.all_data.copy()
 
-        # Update table with filtered data
-        self.table_manager.update_table_data(self.table_manager.filtered_data)
+        # Update table with filtered data, unless it shows the same rows already
+        filtered = self.table_manager.filtered_data
+        signature = (source, tuple(row[0] for row in filtered))
+        if signature != self._last_filter_signature:
+            self.table_manager.update_table_data(filtered)
+            self._last_filter_signature = signature
 
         # Clear table selection to avoid side effects
         try:
@@ -583,18 +676,54 @@ class MainMenu(ttk.Frame):
         # Restore focus/cursor to search_entry after update (avoids "leaving" the field)
         if self.search_entry:
             try:
-                self.search_entry.after_idle(
-                    lambda: (
-                        self.search_entry.focus_set(),
-                        self.search_entry.icursor(tk.END),
-                    )
-                )
+                self.search_entry.after_idle(self._refocus_search)
             except Exception:
                 pass
 
         # update search clear button state (trace also handles it, but we ensure here)
         self.update_search_clear_state()
 
+    def _filter_local(self, lower):
+        """Filters all_data in memory by a lowercased term (database fallback)."""
+        all_data = self.table_manager.all_data
+        if self._haystack_cache[0] is not all_data:
+            # Built once per dataset; columns joined by a separator no term contains
+            haystacks = [
+                "\x00".join(str(col) for col in row).lower() for row in all_data
+            ]
+            self._haystack_cache = (all_data, haystacks)
+            self._last_local_match = ("", None)
+        haystacks = self._haystack_cache[1]
+
+        # A longer term only matches rows the previous one matched
+        last_term, last_indexes = self._last_local_match
+        if last_indexes is not None and lower.startswith(last_term):
+            candidates = last_indexes
+        else:
+            candidates = range(len(all_data))
+        indexes = [i for i in candidates if lower in haystacks[i]]
+        self._last_local_match = (lower, indexes)
+        return [all_data[i] for i in indexes]
+
+    def _schedule_search(self, event=None):
+        """Restarts the debounce timer so only the last keystroke runs on_search."""
+        self._cancel_pending_search()
+        self._search_after_id = self.after(_SEARCH_DEBOUNCE_MS, self._run_scheduled_search)
+
+    def _run_scheduled_search(self):
+        self._search_after_id = None
+        self.on_search()
+
+    def _cancel_pending_search(self):
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+
+    def _refocus_search(self):
+        """Puts focus back on the search entry with the cursor at the end."""
+        self.search_entry.focus_set()
+        self.search_entry.icursor(tk.END)
+
     def on_table_select(self, event=None):
         """Table selection handler."""
         self.table_manager.selected_ids = self.table_manager.get_selected_ids()
@@ -602,6 +731,7 @@ class MainMenu(ttk.Frame):
 
     def clear_search(self):
         """Clears the search: erases the entry, restores the table and focuses the field."""
+        self._cancel_pending_search()
         if self.search_var is not None:
             self.search_var.set("")
         # call on_search to update table (restore all data)
@@ -609,42 +739,36 @@ class MainMenu(ttk.Frame):
         # ensure focus on entry
         if self.search_entry:
             try:
-                self.search_entry.after_idle(
-                    lambda: (
-                        self.search_entry.focus_set(),
-                        self.search_entry.icursor(tk.END),
-                    )
-                )
+                self.search_entry.after_idle(self._refocus_search)
             except Exception:
                 pass
         # button state will be updated via trace
 
     def update_button_states(self):
         """Updates button states based on selection."""
-        has_selection = len(getattr(self.table_manager, "selected_ids", [])) > 0
-        single_selection = len(getattr(self.table_manager, "selected_ids", [])) == 1
-
-        # Update button states (some may not exist until create_buttons)
-        try:
-            self.buttons["btn_delete"].config(
-                state=NORMAL if has_selection else DISABLED
-            )
-        except Exception:
-            pass
-        try:
-            self.buttons["btn_export"].config(
-                state=NORMAL if has_selection else DISABLED
-            )
-        except Exception:
-            pass
-        try:
-            self.buttons["btn_edit"].config(
-                state=NORMAL if single_selection else DISABLED
-            )
-        except Exception:
-            pass
+        selected_count = len(getattr(self.table_manager, "selected_ids", []))
+        has_selection = selected_count > 0
+        single_selection = selected_count == 1
+
+        # Update button states (some may not exist until create_buttons).
+        # Only reconfigure when the state actually changes.
+        for key, enabled in (
+            ("btn_delete", has_selection),
+            ("btn_export", has_selection),
+            ("btn_edit", single_selection),
+        ):
+            state = NORMAL if enabled else DISABLED
+            if self._btn_state.get(key) == state:
+                continue
+            try:
+                self.buttons[key].config(state=state)
+                self._btn_state[key] = state
+            except Exception:
+                pass
 
         # Configure edit/cancel button
+        if self._btn_state.get("edit_mode") == self.edit_mode:
+            return
         try:
             if self.edit_mode:
                 self.buttons["btn_edit"].config(
@@ -656,22 +780,14 @@ class MainMenu(ttk.Frame):
                 self.buttons["btn_edit"].config(
                     text="Editar Nota", bootstyle=WARNING, command=self.edit_invoice
                 )
+            self._btn_state["edit_mode"] = self.edit_mode
         except Exception:
             pass
 
     def save_invoice(self):
         """Saves a new invoice or updates an existing one."""
-        # CORREÇÃO: Usar os nomes corretos das variáveis em inglês
-        data = {
-            "date": self.variables["date_var"].get().strip(),
-            "number": self.variables["number_var"].get().strip(),
-            "customer": self.variables["customer_var"].get().strip(),
-            "value": self.variables["value_var"].get().strip(),
-            "phone": self.variables["phone_var"].get().strip(),
-            "email": self.variables["email_var"].get().strip(),
-            "cnpj": self.variables["cnpj_var"].get().strip(),
-            "address": self.variables["address_var"].get().strip(),
-        }
+        variables = self.variables
+        data = {key: variables[var].get().strip() for key, var in _SAVE_FIELDS}
 
         valid, message = self.add_manager.validate_form(
             date=data["date"],
@@ -701,10 +817,10 @@ class MainMenu(ttk.Frame):
                     )
             else:
                 success = self.add_manager.save_new_invoice(self, **data)
-                if success:
-                    self.update_last_invoice()
 
+            # refresh_data also updates the last invoice frame
             if success:
+                self.controller.notify_listeners(EventKeys.INVOICE_CHANGED)
                 self.refresh_data()
 
         except Exception as e:
@@ -749,7 +865,8 @@ class MainMenu(ttk.Frame):
     def handle_delete_notes(self):
         """Handler for note deletion."""
         selected_ids = getattr(self.table_manager, "selected_ids", [])
-        total_notes = self.database.get_total_invoices()
+        # all_data is kept authoritative by refresh_data
+        total_notes = len(self.table_manager.all_data)
 
         if total_notes == 0:
             show_error(self, "Nenhuma nota encontrada no sistema!")
@@ -765,7 +882,8 @@ class MainMenu(ttk.Frame):
     def handle_export_notes(self):
         """Handler for note export."""
         selected_ids = getattr(self.table_manager, "selected_ids", [])
-        total_notes = self.database.get_total_invoices()
+        # all_data is kept authoritative by refresh_data
+        total_notes = len(self.table_manager.all_data)
 
         if total_notes == 0:
             show_error(self, "Nenhuma nota encontrada no sistema!")
@@ -782,24 +900,101 @@ class MainMenu(ttk.Frame):
         self.backup_module.handle_backup()
 
     def refresh_data(self):
-        """Refreshes the view data."""
-        self.table_manager.all_data = self.database.get_all_invoices()
-        self.table_manager.filtered_data = self.table_manager.all_data.copy()
+        """Refreshes the view data.
+
+        The invoice query runs on the database's reader thread so the UI stays
+        responsive; the widgets are updated by _apply_refresh on the Tk thread.
+        """
+        self._refresh_generation += 1
+        self.database.run_in_background(
+            self._refresh_queue, self._refresh_generation, self._bg_fetch
+        )
+        if self._refresh_after_id is None:
+            self._refresh_after_id = self.after(_REFRESH_POLL_MS, self._poll_refresh)
+
+    def _bg_fetch(self):
+        """Database reader thread: loads all invoices on its cached connection.
+
+        The last inserted invoice (highest id) is taken from the same rows,
+        so the refresh needs no second query for the 'last invoice' frame.
+        """
+        invoices = self.database.get_all_invoices()
+        last_invoice = max(invoices, key=itemgetter(0))[1:5] if invoices else None
+        return invoices, last_invoice
+
+    def _poll_refresh(self):
+        """Applies the result of the latest refresh once it is available."""
+        self._refresh_after_id = None
+        latest = None
+        while True:
+            try:
+                generation, result = self._refresh_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Results from superseded refreshes are discarded
+            if generation == self._refresh_generation:
+                latest = result
+
+        if latest is None:
+            self._refresh_after_id = self.after(_REFRESH_POLL_MS, self._poll_refresh)
+        elif isinstance(latest, Exception):
+            show_error(self, f"Erro ao carregar notas: {latest}")
+        else:
+            self._apply_refresh(*latest)
+
+    def _apply_refresh(self, invoices, last_invoice):
+        """Updates table, form and related widgets with freshly loaded invoices."""
+        self.table_manager.all_data = invoices
+        if (self.search_var.get() or "").strip():
+            self.table_manager.filtered_data = self.table_manager.all_data.copy()
+        else:
+            # No active search: the filtered view is the full data set
+            self.table_manager.filtered_data = self.table_manager.all_data
         self.table_manager.update_table_data(self.table_manager.filtered_data)
-        try:
-            self.table_manager.clear_selection()
-        except Exception:
-            pass
-        self.table_manager.selected_ids = []
-        self.clear_fields()
-        self.update_button_states()
-        self.update_last_invoice()
-        # Reload customers in combobox
+        # Data may have changed: next search must repopulate the table
+        self._last_filter_signature = None
+
+        # clear_fields writes every form variable; recompute the
+        # 'Clear Fields' button state only once at the end
+        with self._suspended_field_traces():
+            try:
+                self.table_manager.clear_selection()
+            except Exception:
+                pass
+            self.table_manager.selected_ids = []
+            self.clear_fields()
+
+        self._show_last_invoice(last_invoice)
+        # Reload customers in combobox (cached, see load_customers)
         self.load_customers()
-        # update states related to fields and search
+        # Button states are recomputed once, in an idle callback
+        self._schedule_state_refresh()
+
+    def _schedule_state_refresh(self):
+        """Coalesces button state updates into one idle callback."""
+        if self._state_refresh_pending:
+            return
+        self._state_refresh_pending = True
+        self.after_idle(self._do_state_refresh)
+
+    def _do_state_refresh(self):
+        """Recomputes action, 'Clear Fields' and search 'Clear' button states."""
+        self._state_refresh_pending = False
+        self.update_button_states()
         self.update_clear_fields_button_state()
         self.update_search_clear_state()
 
+    def destroy(self):
+        """Cancels pending search and refresh callbacks before destroying the view."""
+        self.controller.unregister_listener(
+            EventKeys.CUSTOMER_CHANGED, self.invalidate_customers_cache
+        )
+        self._cancel_pending_search()
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        super().destroy()
+
     def show_about(self):
         """Shows information about the project."""
         from ..utils.popups import ask_yes_no
@@ -4,6 +4,10 @@ Interface para geração de relatórios de notas fiscais usando ttkbootstrap.
 Permite criar relatórios gerais, por período ou por cliente.
 """
 
+import operator
+import queue
+import time
+from functools import lru_cache
 import tkinter as tk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
@@ -13,29 +17,124 @@ from core import utils
 from ..keys import EventKeys
 from ..utils.popups import show_info, show_error, ask_yes_no
 from ..utils import create_info_tooltip, create_success_tooltip, create_warning_tooltip
+from ..modules.invoice_export import InvoiceExport
+
+# Segundos durante os quais um resultado de relatório em cache é reutilizado
+_REPORT_CACHE_TTL = 60
+
+# Linhas materializadas por vez na tabela de resultados
+_REPORT_PAGE_SIZE = 200
+
+# Intervalo (ms) entre verificações de um relatório em geração
+_REPORT_POLL_MS = 50
+
+# Data, número, cliente e valor de uma linha (id, data, número, cliente, valor)
+_CAMPOS_EXIBIDOS = operator.itemgetter(1, 2, 3, 4)
+
+# Valores se repetem muito entre notas; cada um é formatado uma vez
+_formatar_moeda = lru_cache(maxsize=4096)(utils.format_currency)
 
 
 class Report(tb.Frame):
     """View de relatórios com interface ttkbootstrap."""
 
+    # Fontes usadas pela view e pelos diálogos
+    _FONT_TITLE = ("Helvetica", 18, "bold")
+    _FONT_RESULTS_TITLE = ("Courier New", 12, "bold")
+    _FONT_TOTALS = ("Courier New", 10, "bold")
+    _FONT_DIALOG_TITLE = ("Helvetica", 12, "bold")
+    _FONT_LABEL = ("Helvetica", 10)
+    _FONT_ENTRY = ("Helvetica", 11)
+
     def __init__(self, parent, controller, theme_manager, database):
         super().__init__(parent)
         self.controller = controller
         self.theme_manager = theme_manager
         self.database = database
 
+        # Cache de resultados: chave -> (timestamp, notas)
+        self._report_cache = {}
+        # Incrementado a cada invalidação; resultados buscados antes dela
+        # não entram no cache
+        self._cache_epoch = 0
+        self.controller.register_listener(
+            EventKeys.INVOICE_CHANGED, self._invalidate_report_cache
+        )
+
+        # Relatório exibido: consulta (tipo, parâmetros), chave de cache,
+        # total de notas e quantas já estão na tabela
+        self._report_query = None
+        self._report_key = None
+        self._report_total_rows = 0
+        self._rendered_rows = 0
+        self._page_pending = False
+        # Título e assinatura (chave, totais, época do cache) do relatório
+        # exibido; uma nova geração com a mesma assinatura não redesenha
+        self._report_title = ""
+        self._last_render_sig = None
+
+        # Geração em segundo plano: resultados da thread, marcados com a
+        # geração do pedido que os iniciou
+        self._report_queue = queue.Queue()
+        self._report_generation = 0
+        self._report_after_id = None
+
+        # Diálogos de período e cliente, criados no primeiro uso e
+        # ocultados (não destruídos) ao fechar
+        self._period_dialog = None
+        self._client_dialog = None
+
+        # Área de resultados, montada na primeira geração de relatório
+        self._main_container = None
+        self._back_container = None
+        self.results_tree = None
+
+        # Exportador criado na primeira exportação e reaproveitado
+        self._exporter = None
+
         self.create_widgets()
 
+    def destroy(self):
+        """Remove o listener e a consulta pendente antes de destruir a view."""
+        self.controller.unregister_listener(
+            EventKeys.INVOICE_CHANGED, self._invalidate_report_cache
+        )
+        if self._report_after_id is not None:
+            self.after_cancel(self._report_after_id)
+            self._report_after_id = None
+        super().destroy()
+
+    def _invalidate_report_cache(self, data=None):
+        """Descarta os resultados em cache (notas foram alteradas)."""
+        self._report_cache.clear()
+        self._cache_epoch += 1
+
+    def _cache_get(self, key, ttl=_REPORT_CACHE_TTL):
+        """Retorna o resultado em cache se ainda válido, ou None."""
+        cached = self._report_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+
+    def _cached_fetch(self, key, fetch_fn, ttl=_REPORT_CACHE_TTL):
+        """Retorna o resultado do cache se ainda válido; senão consulta o banco."""
+        result = self._cache_get(key, ttl)
+        if result is None:
+            result = fetch_fn()
+            self._report_cache[key] = (time.monotonic(), result)
+        return result
+
     def create_widgets(self):
         """Cria a interface de relatórios."""
         main_container = tb.Frame(self)
         main_container.pack(fill=BOTH, expand=True, padx=20, pady=20)
+        self._main_container = main_container
 
         # Título
         title_label = tb.Label(
             main_container,
             text="Relatório Completo",
-            font=("Helvetica", 18, "bold"),
+            font=self._FONT_TITLE,
             bootstyle=PRIMARY,
         )
         title_label.pack(pady=(0, 20))
@@ -47,8 +146,7 @@ class Report(tb.Frame):
         # Botões de relatório
         self.create_report_buttons(button_container)
 
-        # Área de resultados
-        self.create_results_area(main_container)
+        # A área de resultados é montada em _ensure_results_area
 
         # Botão Voltar
         self.create_back_button(main_container)
@@ -100,42 +198,128 @@ class Report(tb.Frame):
         results_frame = tb.LabelFrame(
             parent, text="Resultado do Relatório", bootstyle=INFO
         )
-        results_frame.pack(fill=BOTH, expand=True, pady=10)
+        results_frame.pack(fill=BOTH, expand=True, pady=10, before=self._back_container)
 
-        # Text widget com scrollbar
-        text_frame = tb.Frame(results_frame)
-        text_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        # Título do relatório
+        self.results_title = tb.Label(
+            results_frame, text="", font=self._FONT_RESULTS_TITLE
+        )
+        self.results_title.pack(fill=X, padx=10, pady=(10, 0))
+
+        # Tabela com scrollbar
+        table_frame = tb.Frame(results_frame)
+        table_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
 
         # Scrollbar vertical
-        scrollbar = tb.Scrollbar(text_frame, bootstyle=ROUND)
-        scrollbar.pack(side=RIGHT, fill=Y)
-
-        # Área de texto
-        self.results_text = tb.Text(
-            text_frame,
-            wrap=WORD,
-            yscrollcommand=scrollbar.set,
+        self.results_scrollbar = tb.Scrollbar(table_frame, bootstyle=ROUND)
+        self.results_scrollbar.pack(side=RIGHT, fill=Y)
+
+        # Tabela virtualizada: as linhas são inseridas por página conforme a
+        # rolagem se aproxima do fim (ver _on_results_scroll)
+        self.results_tree = tb.Treeview(
+            table_frame,
+            columns=("data", "numero", "cliente", "valor"),
+            show="headings",
             height=15,
-            font=("Courier New", 10),
+            yscrollcommand=self._on_results_scroll,
         )
-        self.results_text.pack(side=LEFT, fill=BOTH, expand=True)
-        scrollbar.config(command=self.results_text.yview)
-
-        # Configurar tags para formatação - usando bootstyle para cores temáticas
-        self.results_text.tag_configure("title", font=("Courier New", 12, "bold"))
-        self.results_text.tag_configure("header", font=("Courier New", 10, "bold"))
-        self.results_text.tag_configure("normal", font=("Courier New", 10))
-
-        # Usar cor do tema para sucesso
-        success_color = self.theme_manager.style.colors.success
-        self.results_text.tag_configure(
-            "total", font=("Courier New", 10, "bold"), foreground=success_color
+        self.results_tree.heading("data", text="Data")
+        self.results_tree.heading("numero", text="Número")
+        self.results_tree.heading("cliente", text="Cliente")
+        self.results_tree.heading("valor", text="Valor")
+        self.results_tree.column("data", width=100, stretch=False)
+        self.results_tree.column("numero", width=100, stretch=False)
+        self.results_tree.column("cliente", width=300, stretch=True)
+        self.results_tree.column("valor", width=140, stretch=False, anchor=E)
+        self.results_tree.pack(side=LEFT, fill=BOTH, expand=True)
+        self.results_scrollbar.config(command=self.results_tree.yview)
+
+        # Totais - usando estilo SUCCESS do tema
+        self.results_totals = tb.Label(
+            results_frame,
+            text="",
+            font=self._FONT_TOTALS,
+            bootstyle=SUCCESS,
+        )
+        self.results_totals.pack(fill=X, padx=10, pady=(0, 10))
+
+        # Exportar o relatório exibido sem gerá-lo de novo
+        self.btn_export = tb.Button(
+            results_frame,
+            text="Exportar CSV",
+            bootstyle=PRIMARY,
+            command=self._export_current_report,
+            state=DISABLED,
+            width=15,
         )
+        self.btn_export.pack(pady=(0, 10))
+        create_info_tooltip(self.btn_export, "Exportar o relatório exibido para CSV")
+
+    def _ensure_results_area(self):
+        """Monta a área de resultados se ainda não existir."""
+        if self.results_tree is None:
+            self.create_results_area(self._main_container)
+
+    def _on_results_scroll(self, first, last):
+        """Atualiza a scrollbar e carrega a próxima página perto do fim."""
+        self.results_scrollbar.set(first, last)
+        if (
+            not self._page_pending
+            and self._rendered_rows < self._report_total_rows
+            and float(last) > 0.9
+        ):
+            self._page_pending = True
+            self.after_idle(self._append_page)
+
+    def _append_page(self, pagina=None):
+        """Busca no banco e insere a próxima página de notas do relatório.
+
+        Args:
+            pagina: Linhas já buscadas para esta página, se houver
+        """
+        self._page_pending = False
+        if self._report_query is None:
+            return
+        kind, params = self._report_query
+        inicio = self._rendered_rows
+        if pagina is None:
+            pagina = self._cached_fetch(
+                self._report_key + ("page", inicio),
+                lambda: self.database.get_invoices_page(
+                    kind, inicio, _REPORT_PAGE_SIZE, **params
+                ),
+            )
+        # Formata a página inteira antes de tocar no widget
+        fmt_moeda = _formatar_moeda
+        linhas = [
+            (data_br, numero, cliente, fmt_moeda(valor))
+            for data_br, numero, cliente, valor in map(_CAMPOS_EXIBIDOS, pagina)
+        ]
+        insert = self.results_tree.insert
+        for i, valores in enumerate(linhas, start=inicio):
+            insert("", END, iid=str(i), values=valores)
+        self._rendered_rows = inicio + len(linhas)
+
+    def _clear_results(self, message=""):
+        """Limpa a tabela, o título e os totais do relatório."""
+        if self.results_tree is None:
+            return
+        self.results_tree.delete(*self.results_tree.get_children())
+        self._report_query = None
+        self._report_key = None
+        self._report_total_rows = 0
+        self._rendered_rows = 0
+        self._report_title = ""
+        self._last_render_sig = None
+        self.results_title.config(text=message)
+        self.results_totals.config(text="")
+        self.btn_export.config(state=DISABLED)
 
     def create_back_button(self, parent):
         """Cria o botão para voltar ao menu principal."""
         button_container = tb.Frame(parent)
         button_container.pack(fill=X, pady=(20, 0))
+        self._back_container = button_container
 
         back_btn = tb.Button(
             button_container,
@@ -149,9 +333,9 @@ class Report(tb.Frame):
 
     def _generate_general_report(self):
         """Gera relatório geral com todas as notas."""
-        # CORREÇÃO: get_all_notas() -> get_all_invoices()
-        notas = self.database.get_all_invoices()
-        self._display_report(notas, "Relatório Geral - Todas as Notas")
+        self._display_report(
+            ("general",), "general", {}, "Relatório Geral - Todas as Notas"
+        )
 
     def _generate_period_report(self):
         """Gera relatório por período específico usando calendário."""
@@ -159,18 +343,17 @@ class Report(tb.Frame):
         if not periodo:
             return
 
+        # Datas já validadas pelo diálogo
         inicio, fim = periodo
-
-        try:
-            inicio_sql = datetime.strptime(inicio, "%d/%m/%Y").strftime("%Y-%m-%d")
-            fim_sql = datetime.strptime(fim, "%d/%m/%Y").strftime("%Y-%m-%d")
-        except ValueError:
-            show_error(self, "Formato de data inválido!")
-            return
-
-        # CORREÇÃO: get_notas_por_periodo() -> get_invoices_by_period()
-        notas = self.database.get_invoices_by_period(inicio_sql, fim_sql)
-        self._display_report(notas, f"Relatório - Período: {inicio} a {fim}")
+        inicio_sql = inicio.isoformat()
+        fim_sql = fim.isoformat()
+
+        self._display_report(
+            ("period", inicio_sql, fim_sql),
+            "period",
+            {"start": inicio_sql, "end": fim_sql},
+            f"Relatório - Período: {inicio:%d/%m/%Y} a {fim:%d/%m/%Y}",
+        )
 
     def _generate_client_report(self):
         """Gera relatório por cliente específico."""
@@ -183,21 +366,64 @@ class Report(tb.Frame):
             show_error(self, "Digite o nome do cliente.")
             return
 
-        # CORREÇÃO: get_notas_por_cliente() -> get_invoices_by_customer()
-        notas = self.database.get_invoices_by_customer(cliente)
-        self._display_report(notas, f"Relatório - Cliente: '{cliente}'")
+        self._display_report(
+            ("client", cliente.lower()),
+            "client",
+            {"customer_name": cliente},
+            f"Relatório - Cliente: '{cliente}'",
+        )
 
-    def _show_period_selection(self):
-        """Exibe diálogo para seleção de período com layout vertical."""
+    def _run_dialog(self, dialog):
+        """Exibe um diálogo reutilizável e espera até ele ser ocultado."""
+        dialog.result = None
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        self.wait_variable(dialog.closed_var)
+        return dialog.result
+
+    def _close_dialog(self, dialog, result=None):
+        """Oculta o diálogo (sem destruí-lo) e devolve o resultado."""
+        dialog.result = result
+        dialog.grab_release()
+        dialog.withdraw()
+        dialog.closed_var.set(True)
+
+    def _new_dialog(self, title, w, h):
+        """Cria um Toplevel oculto que é reaproveitado entre usos."""
         dialog = tb.Toplevel(self)
-        dialog.title("Selecionar Período")
+        dialog.withdraw()
+        dialog.title(title)
         dialog.transient(self)
-        dialog.grab_set()
         dialog.resizable(False, False)
+        dialog.result = None
+        dialog.closed_var = tk.BooleanVar(dialog)
+
+        def cancelar(event=None):
+            self._close_dialog(dialog)
+
+        dialog.protocol("WM_DELETE_WINDOW", cancelar)
+        dialog.bind("<Escape>", cancelar)
+
+        # Centralizar diálogo
+        x = (dialog.winfo_screenwidth() // 2) - (w // 2)
+        y = (dialog.winfo_screenheight() // 2) - (h // 2)
+        dialog.geometry(f"{w}x{h}+{x}+{y}")
+        return dialog
+
+    def _show_period_selection(self):
+        """Exibe diálogo para seleção de período; retorna (início, fim) como date ou None."""
+        if self._period_dialog is None:
+            self._period_dialog = self._build_period_dialog()
+        return self._run_dialog(self._period_dialog)
+
+    def _build_period_dialog(self):
+        """Monta o diálogo de período (uma vez por view)."""
+        dialog = self._new_dialog("Selecionar Período", 350, 250)
 
         # Variáveis para as datas
-        data_inicio_var = tk.StringVar()
-        data_fim_var = tk.StringVar()
+        data_inicio_var = tk.StringVar(dialog)
+        data_fim_var = tk.StringVar(dialog)
 
         # Frame principal
         content = tb.Frame(dialog, padding=20)
@@ -206,7 +432,7 @@ class Report(tb.Frame):
         tb.Label(
             content,
             text="Selecione o período:",
-            font=("Helvetica", 12, "bold"),
+            font=self._FONT_DIALOG_TITLE,
             bootstyle=PRIMARY,
         ).pack(pady=(0, 15))
 
@@ -218,7 +444,7 @@ class Report(tb.Frame):
         inicio_frame = tb.Frame(dates_container)
         inicio_frame.pack(fill=X, pady=8)
 
-        tb.Label(inicio_frame, text="Data Inicial:", font=("Helvetica", 10)).pack(
+        tb.Label(inicio_frame, text="Data Inicial:", font=self._FONT_LABEL).pack(
             side=LEFT, padx=(0, 10)
         )
 
@@ -240,7 +466,7 @@ class Report(tb.Frame):
         fim_frame = tb.Frame(dates_container)
         fim_frame.pack(fill=X, pady=8)
 
-        tb.Label(fim_frame, text="Data Final:", font=("Helvetica", 10)).pack(
+        tb.Label(fim_frame, text="Data Final:", font=self._FONT_LABEL).pack(
             side=LEFT, padx=(0, 10)
         )
 
@@ -279,8 +505,7 @@ class Report(tb.Frame):
                 show_error(dialog, "Formato de data inválido!")
                 return
 
-            dialog.result = (data_inicio_var.get(), data_fim_var.get())
-            dialog.destroy()
+            self._close_dialog(dialog, (dt_inicio.date(), dt_fim.date()))
 
         # Container para centralizar os botões
         button_container = tb.Frame(buttons_frame)
@@ -298,7 +523,7 @@ class Report(tb.Frame):
             button_container,
             text="Cancelar",
             bootstyle=SECONDARY,
-            command=dialog.destroy,
+            command=lambda: self._close_dialog(dialog),
             width=15,
         ).pack(side=LEFT, padx=5)
 
@@ -306,25 +531,22 @@ class Report(tb.Frame):
         data_inicio_var.set(date_inicio.entry.get())
         data_fim_var.set(date_fim.entry.get())
 
-        # Centralizar diálogo
-        dialog.update_idletasks()
-        w, h = 350, 250
-        x = (dialog.winfo_screenwidth() // 2) - (w // 2)
-        y = (dialog.winfo_screenheight() // 2) - (h // 2)
-        dialog.geometry(f"{w}x{h}+{x}+{y}")
-
-        dialog.wait_window()
-        return getattr(dialog, "result", None)
+        return dialog
 
     def _show_client_selection(self):
         """Exibe diálogo para seleção de cliente."""
-        dialog = tb.Toplevel(self)
-        dialog.title("Relatório por Cliente")
-        dialog.transient(self)
-        dialog.grab_set()
-        dialog.resizable(False, False)
+        if self._client_dialog is None:
+            self._client_dialog = self._build_client_dialog()
+        dialog = self._client_dialog
+        dialog.entry.select_range(0, END)
+        dialog.entry.focus()
+        return self._run_dialog(dialog)
+
+    def _build_client_dialog(self):
+        """Monta o diálogo de cliente (uma vez por view)."""
+        dialog = self._new_dialog("Relatório por Cliente", 350, 180)
 
-        cliente_var = tk.StringVar()
+        cliente_var = tk.StringVar(dialog)
 
         content = tb.Frame(dialog, padding=20)
         content.pack(fill=BOTH, expand=True)
@@ -332,16 +554,17 @@ class Report(tb.Frame):
         tb.Label(
             content,
             text="Digite o nome do cliente:",
-            font=("Helvetica", 12, "bold"),
+            font=self._FONT_DIALOG_TITLE,
             bootstyle=PRIMARY,
         ).pack(pady=(0, 15))
 
         entry_frame = tb.Frame(content)
         entry_frame.pack(fill=X, pady=15)
 
-        entry = tb.Entry(entry_frame, textvariable=cliente_var, font=("Helvetica", 11))
-        entry.pack(fill=X, padx=5)
-        entry.focus()
+        dialog.entry = tb.Entry(
+            entry_frame, textvariable=cliente_var, font=self._FONT_ENTRY
+        )
+        dialog.entry.pack(fill=X, padx=5)
 
         # Botões centralizados
         buttons_frame = tb.Frame(content)
@@ -355,8 +578,7 @@ class Report(tb.Frame):
                 show_error(dialog, "Digite o nome do cliente!")
                 return
 
-            dialog.result = cliente_var.get().strip()
-            dialog.destroy()
+            self._close_dialog(dialog, cliente_var.get().strip())
 
         tb.Button(
             button_container,
@@ -370,84 +592,137 @@ class Report(tb.Frame):
             button_container,
             text="Cancelar",
             bootstyle=SECONDARY,
-            command=dialog.destroy,
+            command=lambda: self._close_dialog(dialog),
             width=15,
         ).pack(side=LEFT, padx=5)
 
-        # Centralizar diálogo
-        dialog.update_idletasks()
-        w, h = 350, 180
-        x = (dialog.winfo_screenwidth() // 2) - (w // 2)
-        y = (dialog.winfo_screenheight() // 2) - (h // 2)
-        dialog.geometry(f"{w}x{h}+{x}+{y}")
+        return dialog
 
-        dialog.wait_window()
-        return getattr(dialog, "result", None)
+    def _display_report(self, key, kind, params, title):
+        """Gera o relatório, consultando o banco fora da thread da interface.
 
-    def _display_report(self, notas, title):
-        """Exibe o relatório gerado na área de texto."""
-        self.results_text.delete(1.0, tk.END)
+        Com os totais já em cache o relatório é exibido na hora; senão a
+        consulta agregada e a primeira página rodam na thread de leitura do
+        Database (que reaproveita a conexão em cache) e o
+        resultado é aplicado por _poll_report.
+        """
+        self._ensure_results_area()
+        totals = self._cache_get(key + ("totals",))
+        if totals is not None:
+            self._show_report(key, kind, params, title, totals)
+            return
 
-        if not notas:
-            self.results_text.insert(
-                tk.END, "Nenhuma nota encontrada para o relatório.\n", "normal"
-            )
+        # O mesmo relatório continua visível enquanto é atualizado
+        if key != self._report_key:
+            self._clear_results("Gerando relatório...")
+        self._report_generation += 1
+        self.database.run_in_background(
+            self._report_queue,
+            self._report_generation,
+            self._bg_report,
+            self._cache_epoch,
+            key,
+            kind,
+            params,
+            title,
+        )
+        if self._report_after_id is None:
+            self._report_after_id = self.after(_REPORT_POLL_MS, self._poll_report)
+
+    def _bg_report(self, epoch, key, kind, params, title):
+        """Thread de leitura do Database: busca totais e primeira página."""
+        totals = self.database.get_invoice_totals(kind, **params)
+        first_page = self.database.get_invoices_page(
+            kind, 0, _REPORT_PAGE_SIZE, **params
+        )
+        return epoch, key, kind, params, title, totals, first_page
+
+    def _poll_report(self):
+        """Aplica o resultado do pedido de relatório mais recente."""
+        self._report_after_id = None
+        latest = None
+        while True:
+            try:
+                generation, result = self._report_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Resultados de pedidos substituídos são descartados
+            if generation == self._report_generation:
+                latest = result
+
+        if latest is None:
+            self._report_after_id = self.after(_REPORT_POLL_MS, self._poll_report)
+        elif isinstance(latest, Exception):
+            self._clear_results("")
+            show_error(self, f"Erro ao gerar relatório: {latest}")
+        else:
+            epoch, key, kind, params, title, totals, first_page = latest
+            if epoch == self._cache_epoch:
+                now = time.monotonic()
+                self._report_cache[key + ("totals",)] = (now, totals)
+                self._report_cache[key + ("page", 0)] = (now, first_page)
+            self._show_report(key, kind, params, title, totals, first_page)
+
+    def _show_report(self, key, kind, params, title, totals, first_page=None):
+        """Exibe o relatório gerado na tabela de resultados.
+
+        Contagem e soma vêm de uma consulta agregada, exibida antes das
+        linhas; as notas são buscadas no banco página a página.
+        """
+        sig = (key, tuple(totals), self._cache_epoch)
+        if sig == self._last_render_sig:
+            # Já exibido: mantém linhas e posição de rolagem
             return
 
-        total_valor = sum(nota[4] for nota in notas)
-        total_notas = len(notas)
+        total_notas, total_valor = totals
 
-        # Título do relatório
-        self.results_text.insert(tk.END, f"{title}\n\n", "title")
-
-        # Cabeçalho
-        self.results_text.insert(tk.END, "Data       Número     Cliente", "header")
-        self.results_text.insert(tk.END, " " * 20)  # Espaçamento
-        self.results_text.insert(tk.END, "Valor\n", "header")
-        self.results_text.insert(tk.END, "-" * 80 + "\n", "normal")
-
-        # Dados das notas
-        for nota in notas:
-            id_nota, data_br, numero, cliente, valor = nota[:5]
-            # Formatar para caber melhor na tela
-            cliente_display = cliente[:30] + "..." if len(cliente) > 30 else cliente
-            linha = f"{data_br:10} {numero:10} {cliente_display:33} {utils.format_currency(valor):>15}\n"
-            self.results_text.insert(tk.END, linha, "normal")
+        if not total_notas:
+            self._clear_results("Nenhuma nota encontrada para o relatório.")
+            return
 
-        # Totais - usando estilo SUCCESS do tema
-        self.results_text.insert(tk.END, "\n" + "=" * 80 + "\n", "normal")
-        self.results_text.insert(tk.END, f"Total de notas: {total_notas}\n", "total")
-        self.results_text.insert(tk.END, f"Valor total: {utils.format_currency(total_valor)}\n", "total")
+        self._clear_results(title)
+        self.results_totals.config(
+            text=f"Total de notas: {total_notas}    "
+            f"Valor total: {utils.format_currency(total_valor)}"
+        )
+
+        # Só a primeira página é buscada agora; as demais ao rolar
+        self._report_query = (kind, params)
+        self._report_key = key
+        self._report_total_rows = total_notas
+        self._append_page(first_page)
+        self._report_title = title
+        self._last_render_sig = sig
+        self.btn_export.config(state=NORMAL)
 
         # Perguntar se deseja exportar
-        self.results_text.insert(tk.END, "\n" + "-" * 80 + "\n", "normal")
         exportar = ask_yes_no(
             self, "Deseja exportar este relatório para um arquivo CSV?"
         )
 
         if exportar == "Sim":
-            self._export_report(notas, title)
+            self._export_current_report()
+
+    def _export_current_report(self):
+        """Exporta para CSV todas as notas do relatório exibido."""
+        if self._report_query is None:
+            return
+        kind, params = self._report_query
+        notas = self.database.get_invoices_export_rows(kind, **params)
+        self._export_report(notas, self._report_title)
 
     def _export_report(self, notas, title):
         """Exporta o relatório para CSV."""
-        # CORREÇÃO: Importar o módulo correto (invoice_export em vez de export_note)
-        from ..modules.invoice_export import InvoiceExport
-
-        # Extrair IDs das notas
-        note_ids = [nota[0] for nota in notas]
-
-        # Usar o módulo de exportação existente
-        export_module = InvoiceExport(
-            self, self.controller, self.theme_manager, self.database
-        )
-        export_module.export_invoices(
-            note_ids, f"relatorio_{title.lower().replace(' ', '_')}"
+        # Usar o módulo de exportação existente, com as linhas já buscadas
+        if self._exporter is None:
+            self._exporter = InvoiceExport(
+                self, self.controller, self.theme_manager, self.database
+            )
+        self._exporter.export_invoice_rows(
+            notas, f"relatorio_{title.lower().replace(' ', '_')}"
         )
 
     def refresh_data(self):
         """Atualiza os dados da view (implementação para compatibilidade)."""
         # Limpar área de resultados
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(
-            tk.END, "Selecione um tipo de relatório para gerar...", "normal"
-        )
\ No newline at end of file
+        self._clear_results("Selecione um tipo de relatório para gerar...")
@@ -17,6 +17,8 @@ class SearchManager:
         self.database = database
         self.search_var = tk.StringVar()
         self.cliente_combobox = None
+        # Linhas completas dos clientes, indexadas pelo nome exibido
+        self._clientes_by_name = {}
 
     def create_search_bar(self, parent, on_search_callback):
         """Cria a barra de pesquisa usando grid."""
@@ -72,9 +74,9 @@ class SearchManager:
     def carregar_clientes(self):
         """Carrega a lista de clientes na combobox."""
         try:
-            clientes = self.database.get_all_clientes()
-            nomes_clientes = [cliente[1] for cliente in clientes]
-            self.cliente_combobox["values"] = nomes_clientes
+            clientes = self.database.get_all_customers()
+            self._clientes_by_name = {cliente[1]: cliente for cliente in clientes}
+            self.cliente_combobox["values"] = list(self._clientes_by_name)
         except Exception as e:
             print(f"Erro ao carregar clientes: {e}")
 
@@ -85,7 +87,10 @@ class SearchManager:
             return
 
         try:
-            cliente = self.database.get_cliente_por_nome(nome_cliente)
+            # Linha já carregada com a lista; sem nova consulta ao banco
+            cliente = self._clientes_by_name.get(nome_cliente)
+            if cliente is None:
+                cliente = self.database.get_customer_by_name(nome_cliente)
             if cliente:
                 _, nome, telefone, email, cnpj, endereco = cliente
                 variables["cliente_var"].set(nome or "")
@@ -123,8 +128,9 @@ class SearchManager:
         if not termo:
             return all_notes.copy()
 
+        # Filtragem feita no banco (índice FTS, com LIKE como reserva)
         try:
-            return self.database.buscar_notas_por_termo(termo)
+            return self.database.search_invoices_fts(termo)
         except Exception:
             termo_l = termo.lower()
             return [
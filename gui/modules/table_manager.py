@@ -3,8 +3,13 @@
 Module for managing generic tables (Invoices, Customers, etc.) using grid.
 """
 
-import re
+import bisect
+import logging
+import os
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache, partial, wraps
 
 import tkinter as tk
 import ttkbootstrap as ttk
@@ -13,20 +18,131 @@ from ttkbootstrap.tableview import Tableview
 from core import utils
 from ..utils.popups import show_error
 
+class _DigitsOnlyTable(dict):
+    """str.translate table that deletes every non-digit character.
+
+    Keeps exactly what the regex digit class matches (str.isdecimal). Each
+    code point is classified once and remembered, so translate runs as a
+    plain C loop over dict lookups.
+    """
+
+    def __missing__(self, code):
+        self[code] = code if chr(code).isdecimal() else None
+        return self[code]
+
+
+_DIGITS_ONLY = _DigitsOnlyTable()
+# Same, but keeps the decimal comma as a dot: "R$ 1.234,56" -> "1234.56"
+_CURRENCY_DIGITS = _DigitsOnlyTable({ord(","): ord(".")})
+
+# Padding for database rows shorter than the table's column count
+_PAD = ("",) * 9
+
+# Rows inserted per step when filling a table; larger fills continue in
+# timer callbacks so the window keeps handling events
+_INSERT_CHUNK = 500
+
+# Rows inserted synchronously by a refresh: the visible window (tables are
+# 15 rows high) plus a few pages of scroll margin; the rest follow in chunks
+_FIRST_CHUNK = 100
+
+# Distinct values kept by the invoice table's formatted-value cache
+_CURRENCY_CACHE_MAX = 50000
+
+# Set CONTROLE_NOTAS_TABLE_PERF=1 to log (to stderr) how long row syncs and
+# sorts take. Both are bound by Tk calls rather than Python computation, so
+# measure before optimizing either
+_log = logging.getLogger(__name__)
+_PROFILE = bool(os.environ.get("CONTROLE_NOTAS_TABLE_PERF"))
+if _PROFILE:
+    _log.setLevel(logging.DEBUG)
+    _log.addHandler(logging.StreamHandler())
+
+
+def _profiled(func):
+    """Logs func's duration at debug level when _PROFILE is set.
+
+    Without it func is returned unchanged, so normal runs pay nothing.
+    """
+    if not _PROFILE:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = (time.perf_counter_ns() - start) / 1e6
+            _log.debug("%s: %.2f ms", func.__qualname__, elapsed)
+
+    return wrapper
+
+
+@lru_cache(maxsize=8192)
+def _parse_date(text):
+    """Parses dd/mm/yyyy (or ISO yyyy-mm-dd) text; datetime.min if invalid.
+
+    Many invoices share a date, so results are cached; the dd/mm/yyyy and
+    ISO forms are parsed by slicing, which is much cheaper than strptime.
+    """
+    digits = text[0:2] + text[3:5] + text[6:10]
+    if len(text) == 10 and text[2] == text[5] == "/" and digits.isascii() and digits.isdigit():
+        try:
+            return datetime(int(text[6:10]), int(text[3:5]), int(text[0:2]))
+        except ValueError:
+            return datetime.min
+
+    digits = text[0:4] + text[5:7] + text[8:10]
+    if len(text) == 10 and text[4] == text[7] == "-" and digits.isascii() and digits.isdigit():
+        try:
+            return datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+        except ValueError:
+            return datetime.min
+
+    try:
+        return datetime.strptime(text, "%d/%m/%Y")
+    except Exception:
+        # fallback trying ISO
+        try:
+            return datetime.strptime(text, "%Y-%m-%d")
+        except Exception:
+            return datetime.min
+
 
 class SortManager:
     """Custom sorting manager for tables"""
 
+    def __init__(self, rows=None):
+        # Callable returning {iid: row values} for the table's rows, so sort
+        # keys are built without reading every cell back from Tk
+        self._rows = rows
+        # col_id -> {iid: sort key} for cells already parsed
+        self._key_cache = {}
+        # col_id -> direction of the next sort (True = descending)
+        self._reverse_state = {}
+        # (col_id, column, sort function, reverse) of the order currently
+        # shown, None once the rows are back in data order
+        self._active_sort = None
+
+    def invalidate_keys(self, iids=None):
+        """Forgets cached sort keys of the given rows (all rows if None)."""
+        if iids is None:
+            self._key_cache.clear()
+            return
+        for keys in self._key_cache.values():
+            for iid in iids:
+                keys.pop(iid, None)
+
     @staticmethod
     def sort_numeric_currency(value):
         """Converts currency values to numeric"""
         if not value or value == "-":
             return 0.0
 
-        # Remove everything that's not a digit or comma (keeps decimal separator)
-        cleaned = re.sub(r"[^\d,]", "", str(value))
-        # Replace comma with dot for float
-        cleaned = cleaned.replace(".", "").replace(",", ".")
+        # Keep only digits and the decimal comma (as a dot for float), in
+        # one translate pass
+        cleaned = str(value).translate(_CURRENCY_DIGITS)
         try:
             return float(cleaned)
         except Exception:
@@ -38,14 +154,7 @@ class SortManager:
         if not value or value == "-":
             return datetime.min
 
-        try:
-            return datetime.strptime(str(value), "%d/%m/%Y")
-        except Exception:
-            # fallback trying ISO
-            try:
-                return datetime.strptime(str(value), "%Y-%m-%d")
-            except Exception:
-                return datetime.min
+        return _parse_date(value if type(value) is str else str(value))
 
     @staticmethod
     def sort_numeric(value):
@@ -54,99 +163,147 @@ class SortManager:
             return 0
 
         try:
-            return int(re.sub(r"[^\d]", "", str(value)))
+            return int(str(value).translate(_DIGITS_ONLY))
         except Exception:
             return 0
 
     @staticmethod
     def sort_string(value):
         """Case-insensitive string sorting"""
-        return (str(value) or "").lower()
+        # Cells read back from the treeview are already str
+        if type(value) is str:
+            return value.lower()
+        return "" if value is None else str(value).lower()
 
     @staticmethod
     def sort_phone(value):
         """Specific sorting for phones"""
         if not value:
             return ""
-        return re.sub(r"[^\d]", "", str(value))
+        return str(value).translate(_DIGITS_ONLY)
 
     @staticmethod
     def sort_cnpj(value):
         """Specific sorting for CNPJ"""
         if not value:
             return ""
-        return re.sub(r"[^\d]", "", str(value))
+        return str(value).translate(_DIGITS_ONLY)
 
     def configure_column_sorting(self, treeview, col_id, sort_function):
         """Configures custom sorting for a specific column"""
+        # Ascending order first time; _sort_command flips it per click
+        self._reverse_state[col_id] = False
+        column = list(treeview["columns"]).index(col_id)
+        treeview.heading(
+            col_id,
+            command=partial(self._sort_command, treeview, col_id, column, sort_function),
+        )
 
-        def sort_by_column(reverse):
-            # Get all items (cell value, item_id)
-            items = [
-                (treeview.set(child, col_id), child)
-                for child in treeview.get_children("")
-            ]
-
-            # Sort using custom function (applied to cell value)
-            items.sort(key=lambda x: sort_function(x[0]), reverse=reverse)
-
-            # Reorganize items in treeview
-            for index, (_, child) in enumerate(items):
-                treeview.move(child, "", index)
+    @_profiled
+    def _sort_command(self, treeview, col_id, column, sort_function):
+        """Heading command: sorts the rows by col_id and toggles direction."""
+        reverse = self._reverse_state.get(col_id, False)
+        self._reverse_state[col_id] = not reverse
+        self._sort_rows(treeview, col_id, column, sort_function, reverse)
+
+    def _sort_rows(self, treeview, col_id, column, sort_function, reverse):
+        """Orders the treeview rows by col_id and records the active sort."""
+        # Sort keys of every row; keys parsed on an earlier sort of this
+        # column are reused, and cells repeating a value (dates, amounts,
+        # names) are parsed once
+        keys = self._key_cache.setdefault(col_id, {})
+        by_value = {}
+        rows = self._rows() if self._rows is not None else {}
+        children = treeview.get_children("")
+        for child in children:
+            if child not in keys:
+                row = rows.get(child)
+                value = row[column] if row is not None else treeview.set(child, col_id)
+                key = by_value.get(value)
+                if key is None:
+                    key = by_value[value] = sort_function(value)
+                keys[child] = key
+
+        # Keys are plain numbers/strings/datetimes compared in C; sorting
+        # the iids directly avoids building a (key, iid) tuple per row
+        ordered = sorted(children, key=keys.__getitem__, reverse=reverse)
+
+        # Reorganize items in treeview with a single relink
+        treeview.set_children("", *ordered)
+        self._active_sort = (col_id, column, sort_function, reverse)
+
+    def reapply_active_sort(self, treeview):
+        """Sorts the rows again by the active sort; False if none is shown."""
+        if self._active_sort is None:
+            return False
+        self._sort_rows(treeview, *self._active_sort)
+        return True
+
+    def clear_active_sort(self):
+        """Records that the rows are no longer in a sorted order."""
+        self._active_sort = None
+
+    def sorted_position(self, treeview, iid, row):
+        """Index at which row (iid) keeps the current sort order.
+
+        Returns None when no sort is shown or a displayed row has no cached
+        key (it changed since the sort), so the caller falls back to data
+        order.
+        """
+        if self._active_sort is None:
+            return None
+        col_id, column, sort_function, reverse = self._active_sort
+        keys = self._key_cache.get(col_id, {})
+        ordered = []
+        for child in treeview.get_children(""):
+            key = keys.get(child)
+            if key is None:
+                return None
+            ordered.append(key)
+
+        key = keys[iid] = sort_function(row[column])
+        if reverse:
+            ordered.reverse()
+            return len(ordered) - bisect.bisect_left(ordered, key)
+        return bisect.bisect_right(ordered, key)
 
-            # Reconfigure heading to invert next time
-            treeview.heading(col_id, command=lambda: sort_by_column(not reverse))
 
-        # Configure initial heading (ascending order first time)
-        treeview.heading(col_id, command=lambda: sort_by_column(False))
+class BaseTableManager:
+    """Base class for managing generic tables.
 
+    Subclasses declare the frame title, the column specs and the sorting
+    function of each heading, and implement update_table_data.
+    """
 
-class BaseTableManager:
-    """Base class for managing generic tables."""
+    _TITLE = ""
+    _COLDATA = ()
+    _SORT_CONFIG = {}
 
     def __init__(self, database):
         self.database = database
         self.table = None
+        # Treeview inside the Tableview, set by create_table
+        self._view = None
         self.selected_ids = []
         self.all_data = []
         self.filtered_data = []
-        self.sort_manager = SortManager()
-
-    def bind_selection_event(self, callback):
-        """Binds table selection event."""
-        if self.table and hasattr(self.table, "view"):
-            self.table.view.bind("<<TreeviewSelect>>", callback)
-
-    def get_selected_ids(self):
-        """Gets IDs of selected items."""
-        if not self.table or not hasattr(self.table, "view"):
-            return []
-
-        selected_iids = list(self.table.view.selection())
-        selected_ids = []
-
-        for iid in selected_iids:
-            try:
-                values = self.table.view.item(iid).get("values", [])
-                if values:
-                    selected_ids.append(int(values[0]))
-            except Exception:
-                continue
-        return selected_ids
-
-    def clear_selection(self):
-        """Clears table selection."""
-        if self.table and hasattr(self.table, "view"):
-            self.table.view.selection_remove(self.table.view.selection())
-
-
-class InvoicesTableManager(BaseTableManager):
-    """Manages Invoices table."""
+        self.sort_manager = SortManager(self._current_rows)
+        # (col_id, sort function) pairs, resolved from the headings once
+        self._sort_bindings = None
+        # Heading sort commands are attached (coldata never changes)
+        self._sorting_configured = False
+        # Rows of the treeview, including queued ones: iid (str of the
+        # record id) -> values, in display order
+        self._row_index = {}
+        # New rows not inserted yet and the timer that inserts the next chunk
+        self._pending_rows = []
+        self._pending_after_id = None
+        # Selection callback and the selection it last reported
+        self._on_select = None
+        self._reported_selection = None
 
     def create_table(self, parent):
-        list_frame = ttk.LabelFrame(
-            parent, text="Notas Fiscais Cadastradas", bootstyle=INFO
-        )
+        list_frame = ttk.LabelFrame(parent, text=self._TITLE, bootstyle=INFO)
         list_frame.columnconfigure(0, weight=1)
         list_frame.rowconfigure(0, weight=1)
 
@@ -155,37 +312,30 @@ class InvoicesTableManager(BaseTableManager):
         table_container.columnconfigure(0, weight=1)
         table_container.rowconfigure(0, weight=1)
 
-        # Table columns (text -> displayed heading)
-        coldata = [
-            {"text": "ID", "stretch": False, "width": 50},
-            {"text": "Data", "stretch": False, "width": 100},
-            {"text": "Número", "stretch": False, "width": 100},
-            {"text": "Cliente", "stretch": True, "width": 150},
-            {"text": "Valor", "stretch": False, "width": 120},
-            {"text": "Telefone", "stretch": False, "width": 120},
-            {"text": "Email", "stretch": True, "width": 150},
-            {"text": "CNPJ", "stretch": False, "width": 140},
-            {"text": "Endereço", "stretch": True, "width": 200},
-        ]
-
         self.table = Tableview(
             table_container,
-            coldata=coldata,
+            # Tableview only reads the column specs; pass it a list as documented
+            coldata=list(self._COLDATA),
             rowdata=[],
             paginated=False,
             searchable=False,
             bootstyle=PRIMARY,
-            autofit=True,
             autoalign=True,
             height=15,
         )
         self.table.grid(row=0, column=0, sticky="nsew")
+        self._view = self.table.view
+        # Rows live in the treeview, not in the Tableview's row model, so its
+        # header sort and right-click menu (which act on that model) are
+        # removed; headings sort through SortManager instead
+        for sequence in ("<Button-1>", "<Button-2>", "<Button-3>"):
+            self._view.unbind(sequence)
 
         scrollbar = ttk.Scrollbar(
-            table_container, orient=VERTICAL, command=self.table.view.yview
+            table_container, orient=VERTICAL, command=self._view.yview
         )
         scrollbar.grid(row=0, column=1, sticky="ns")
-        self.table.view.configure(yscrollcommand=scrollbar.set)
+        self._view.configure(yscrollcommand=scrollbar.set)
 
         # Configure custom sorting (applies through current headings)
         self.configure_custom_sorting()
@@ -194,223 +344,320 @@ class InvoicesTableManager(BaseTableManager):
 
     def configure_custom_sorting(self):
         """Configures custom sorting for each column"""
-        if not self.table or not hasattr(self.table, "view"):
+        if self._view is None or self._sorting_configured:
             return
+        self._apply_sort_bindings(self._SORT_CONFIG)
 
-        treeview = self.table.view
-
-        # Map heading text to sorting function
-        sort_config = {
-            "ID": self.sort_manager.sort_numeric,
-            "Data": self.sort_manager.sort_date,
-            "Número": self.sort_manager.sort_numeric,
-            "Cliente": self.sort_manager.sort_string,
-            "Valor": self.sort_manager.sort_numeric_currency,
-            "Telefone": self.sort_manager.sort_phone,
-            "Email": self.sort_manager.sort_string,
-            "CNPJ": self.sort_manager.sort_cnpj,
-            "Endereço": self.sort_manager.sort_string,
-        }
-
-        # For each treeview column, discover heading text and apply function if exists
-        for col_id in treeview["columns"]:
-            heading_info = treeview.heading(col_id)
-            heading_text = (
-                heading_info.get("text")
-                if isinstance(heading_info, dict)
-                else heading_info
-            )
-            if heading_text in sort_config:
-                # pass col_id (real id) to configure_column_sorting
-                self.sort_manager.configure_column_sorting(
-                    treeview, col_id, sort_config[heading_text]
-                )
-
-    def update_table_data(self, invoices):
+    def update_table_data(self, rows):
         """Updates table data."""
+        raise NotImplementedError
+
+    def _current_rows(self):
+        return self._row_index
+
+    def bind_selection_event(self, callback):
+        """Binds table selection event."""
+        self._on_select = callback
+        if self._view is not None:
+            self._view.bind("<<TreeviewSelect>>", self._dispatch_select)
+
+    def _dispatch_select(self, event=None):
+        """Runs the selection callback once per actual selection change.
+
+        Tk queues a <<TreeviewSelect>> for each delete/relink that touches
+        selected rows, so a rebuild can deliver a burst of identical events;
+        only the first one with a new selection reaches the callback.
+        """
+        selection = self._view.selection()
+        if selection == self._reported_selection:
+            return
+        self._reported_selection = selection
+        if self._on_select is not None:
+            self._on_select(event)
+
+    @contextmanager
+    def _bulk_update(self):
+        """Hides the data columns while many rows change.
+
+        With displaycolumns empty the treeview has no cells to lay out, so the
+        inserts and relinks inside the block cost no per-row layout work.
+        """
+        view = self._view
+        displaycolumns = view["displaycolumns"]
+        view.configure(displaycolumns=())
         try:
-            rowdata = []
-            for invoice in invoices:
-                # Ensure we have at least 9 elements
-                invoice = (
-                    tuple(list(invoice) + [""] * (9 - len(invoice)))
-                    if len(invoice) < 9
-                    else invoice
-                )
+            yield view
+        finally:
+            try:
+                view.configure(displaycolumns=displaycolumns)
+            except tk.TclError:
+                # Table destroyed meanwhile
+                pass
+
+    def get_selected_ids(self):
+        """Gets IDs of selected items."""
+        if self._view is None:
+            return []
 
-                invoice_id = invoice[0]
-                date_br = invoice[1] if len(invoice) > 1 else "-"
-                number = invoice[2] if len(invoice) > 2 else "-"
-                customer = invoice[3] if len(invoice) > 3 else "-"
-                value = utils.format_currency(invoice[4]) if len(invoice) > 4 else "-"
-                phone = invoice[5] if len(invoice) > 5 else ""
-                email = invoice[6] if len(invoice) > 6 else ""
-                cnpj = invoice[7] if len(invoice) > 7 else ""
-                address = invoice[8] if len(invoice) > 8 else ""
-
-                rowdata.append(
-                    (
-                        invoice_id,
-                        date_br,
-                        number,
-                        customer,
-                        value,
-                        phone or "-",
-                        email or "-",
-                        cnpj or "-",
-                        address or "-",
-                    )
+        # Rows are keyed by iid with the record id in their first field (see
+        # _sync_rows), so the selection alone gives the ids: one Tk call,
+        # no cell reads and no string parsing
+        rows = self._row_index
+        return [rows[iid][0] for iid in self._view.selection() if iid in rows]
+
+    def _apply_sort_bindings(self, sort_config):
+        """Attaches sort functions to the headings.
+
+        Heading texts are read (one Tcl call per column) only the first time;
+        rebuilds keep the same column ids, so later calls reuse the pairs.
+        Headings keep their commands until rebuilt, so once attached this is
+        a no-op; clear _sorting_configured after rebuilding the headings.
+        """
+        if self._sorting_configured:
+            return
+        treeview = self._view
+
+        if self._sort_bindings is None:
+            bindings = []
+            # For each treeview column, discover heading text and apply function if exists
+            for col_id in treeview["columns"]:
+                heading_info = treeview.heading(col_id)
+                heading_text = (
+                    heading_info.get("text")
+                    if isinstance(heading_info, dict)
+                    else heading_info
                 )
+                if heading_text in sort_config:
+                    bindings.append((col_id, sort_config[heading_text]))
+            self._sort_bindings = bindings
+
+        for col_id, sort_function in self._sort_bindings:
+            self.sort_manager.configure_column_sorting(treeview, col_id, sort_function)
+        self._sorting_configured = True
+
+    @_profiled
+    def _sync_rows(self, rowdata):
+        """Makes the treeview show rowdata, touching only rows that changed.
+
+        rowdata may be any iterable of row tuples; it is read once.
+
+        Rows are keyed by record id (first column, also used as iid): removed
+        ids are deleted, changed rows updated in place, new ones inserted, and
+        the display order fixed with a single set_children call.
+        """
+        # Rows still queued from a previous call go in first, so the
+        # treeview matches _row_index before diffing
+        self._flush_pending_rows()
+
+        old_index = self._row_index
+        new_index = {str(row[0]): row for row in rowdata}
+
+        with self._bulk_update() as view:
+            removed = [iid for iid in old_index if iid not in new_index]
+            if removed:
+                view.delete(*removed)
+
+            added = []
+            changed = []
+            get_old = old_index.get
+            item = view.item
+            for iid, row in new_index.items():
+                old_row = get_old(iid)
+                if old_row is None:
+                    added.append((iid, row))
+                elif old_row != row:
+                    item(iid, values=row)
+                    changed.append(iid)
+
+            # iids are record ids and may come back later with other values
+            self.sort_manager.invalidate_keys(removed + changed)
+
+            self._row_index = new_index
+            position = None
+            if len(added) == 1 and not removed and not changed:
+                # A single new row (the usual add) joins a sorted view at its
+                # place instead of resetting the rows to data order
+                iid, row = added[0]
+                position = self.sort_manager.sorted_position(view, iid, row)
+
+            if position is not None:
+                view.insert("", position, iid=iid, values=row)
+            elif added:
+                # Only the first screenfuls are inserted now, the rest in
+                # later timer callbacks; the last one fixes the display order
+                self.sort_manager.clear_active_sort()
+                self._pending_rows = added
+                self._insert_pending_rows(_FIRST_CHUNK)
+            elif list(old_index) != list(new_index):
+                self.sort_manager.clear_active_sort()
+                view.set_children("", *new_index)
+
+    def _insert_pending_rows(self, limit=None):
+        """Inserts up to limit queued rows (all if None) and orders the view.
+
+        While rows remain queued the next chunk is scheduled with after(), so
+        Tk handles input and redraws between chunks. A sort picked from a
+        heading meanwhile is applied again after each chunk.
+        """
+        self._pending_after_id = None
+        chunk = self._pending_rows if limit is None else self._pending_rows[:limit]
+        self._pending_rows = self._pending_rows[len(chunk):]
 
-            coldata = [
-                {"text": "ID", "stretch": False, "width": 50},
-                {"text": "Data", "stretch": False, "width": 100},
-                {"text": "Número", "stretch": False, "width": 100},
-                {"text": "Cliente", "stretch": True, "width": 150},
-                {"text": "Valor", "stretch": False, "width": 120},
-                {"text": "Telefone", "stretch": False, "width": 120},
-                {"text": "Email", "stretch": True, "width": 150},
-                {"text": "CNPJ", "stretch": False, "width": 140},
-                {"text": "Endereço", "stretch": True, "width": 200},
-            ]
-
-            if hasattr(self.table, "build_table_data"):
-                # Rebuild content (recreates headings internally)
-                self.table.build_table_data(coldata, rowdata)
-                # after rebuilding, reapply custom sorting
-                self.configure_custom_sorting()
-            else:
-                # Fallback for older ttkbootstrap versions
-                for item in self.table.view.get_children():
-                    self.table.view.delete(item)
-                for row in rowdata:
-                    self.table.view.insert("", "end", values=row)
+        try:
+            with self._bulk_update() as view:
+                # Inserting at the head is O(1) in Tk, while "end" walks the
+                # sibling list on every call; reversed keeps the relative order
+                insert = view.insert
+                for iid, row in reversed(chunk):
+                    insert("", 0, iid=iid, values=row)
+
+                # A heading clicked while chunks are queued keeps its order
+                if not self.sort_manager.reapply_active_sort(view):
+                    if self._pending_rows:
+                        # Rows shown so far, already in their final relative order
+                        pending = {iid for iid, _ in self._pending_rows}
+                        view.set_children("", *[iid for iid in self._row_index if iid not in pending])
+                    else:
+                        view.set_children("", *self._row_index)
+
+                if self._pending_rows:
+                    self._pending_after_id = view.after(1, self._insert_pending_rows, _INSERT_CHUNK)
+        except tk.TclError:
+            # Table destroyed while rows were still queued
+            self._pending_rows = []
+
+    def _flush_pending_rows(self):
+        """Inserts every queued row now, cancelling the scheduled chunk."""
+        if self._pending_after_id is not None:
+            self._view.after_cancel(self._pending_after_id)
+        if self._pending_rows:
+            self._insert_pending_rows()
 
-        except Exception as e:
-            show_error(None, f"Erro ao atualizar tabela: {e}")
+    def clear_selection(self):
+        """Clears table selection."""
+        if self._view is not None:
+            self._view.selection_remove(self._view.selection())
 
 
-class CustomersTableManager(BaseTableManager):
-    """Manages Customers table."""
+class _CurrencyText(dict):
+    """Maps a raw value to its format_currency text, formatting each value once."""
 
-    def create_table(self, parent):
-        list_frame = ttk.LabelFrame(parent, text="Clientes Cadastrados", bootstyle=INFO)
-        list_frame.columnconfigure(0, weight=1)
-        list_frame.rowconfigure(0, weight=1)
+    def __missing__(self, value):
+        text = self[value] = utils.format_currency(value)
+        return text
 
-        table_container = ttk.Frame(list_frame)
-        table_container.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-        table_container.columnconfigure(0, weight=1)
-        table_container.rowconfigure(0, weight=1)
 
-        coldata = [
-            {"text": "ID", "stretch": False, "width": 50},
-            {"text": "Nome", "stretch": True, "width": 150},
-            {"text": "Telefone", "stretch": True, "width": 120},
-            {"text": "Email", "stretch": True, "width": 150},
-            {"text": "CNPJ", "stretch": True, "width": 120},
-            {"text": "Endereço", "stretch": True, "width": 200},
-        ]
+class InvoicesTableManager(BaseTableManager):
+    """Manages Invoices table."""
 
-        self.table = Tableview(
-            table_container,
-            coldata=coldata,
-            rowdata=[],
-            paginated=False,
-            searchable=False,
-            bootstyle=PRIMARY,
-            autofit=True,
-            autoalign=True,
-            height=15,
-        )
-        self.table.grid(row=0, column=0, sticky="nsew")
+    _TITLE = "Notas Fiscais Cadastradas"
+
+    # Table columns (text -> displayed heading)
+    _COLDATA = (
+        {"text": "ID", "stretch": False, "width": 50},
+        {"text": "Data", "stretch": False, "width": 100},
+        {"text": "Número", "stretch": False, "width": 100},
+        {"text": "Cliente", "stretch": True, "width": 150},
+        {"text": "Valor", "stretch": False, "width": 120},
+        {"text": "Telefone", "stretch": False, "width": 120},
+        {"text": "Email", "stretch": True, "width": 150},
+        {"text": "CNPJ", "stretch": False, "width": 140},
+        {"text": "Endereço", "stretch": True, "width": 200},
+    )
+
+    # Heading text -> sorting function
+    _SORT_CONFIG = {
+        "ID": SortManager.sort_numeric,
+        "Data": SortManager.sort_date,
+        "Número": SortManager.sort_numeric,
+        "Cliente": SortManager.sort_string,
+        "Valor": SortManager.sort_numeric_currency,
+        "Telefone": SortManager.sort_phone,
+        "Email": SortManager.sort_string,
+        "CNPJ": SortManager.sort_cnpj,
+        "Endereço": SortManager.sort_string,
+    }
 
-        scrollbar = ttk.Scrollbar(
-            table_container, orient=VERTICAL, command=self.table.view.yview
-        )
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        self.table.view.configure(yscrollcommand=scrollbar.set)
+    def __init__(self, database):
+        super().__init__(database)
+        # Formatted values, kept across refreshes (amounts repeat often)
+        self._currency_text = _CurrencyText()
 
-        # Configure custom sorting
-        self.configure_custom_sorting()
+    def update_table_data(self, invoices):
+        """Updates table data."""
+        try:
+            # Short rows (e.g. search results) are padded with "" to 9 fields;
+            # rows are generated straight into _sync_rows' index, no list
+            currency = self._currency_text
+            if len(currency) > _CURRENCY_CACHE_MAX:
+                currency.clear()
+            rowdata = (
+                (
+                    invoice_id,
+                    date_br,
+                    number,
+                    customer,
+                    currency[value],
+                    phone or "-",
+                    email or "-",
+                    cnpj or "-",
+                    address or "-",
+                )
+                for invoice_id, date_br, number, customer, value, phone, email, cnpj, address
+                in ((tuple(invoice) + _PAD)[:9] for invoice in invoices)
+            )
 
-        return list_frame
+            # Headings (and their sort commands) are left untouched
+            self._sync_rows(rowdata)
 
-    def configure_custom_sorting(self):
-        """Configures custom sorting for each column"""
-        if not self.table or not hasattr(self.table, "view"):
-            return
+        except Exception as e:
+            show_error(None, f"Erro ao atualizar tabela: {e}")
 
-        treeview = self.table.view
-
-        sort_config = {
-            "ID": self.sort_manager.sort_numeric,
-            "Nome": self.sort_manager.sort_string,
-            "Telefone": self.sort_manager.sort_phone,
-            "Email": self.sort_manager.sort_string,
-            "CNPJ": self.sort_manager.sort_cnpj,
-            "Endereço": self.sort_manager.sort_string,
-        }
-
-        for col_id in treeview["columns"]:
-            heading_info = treeview.heading(col_id)
-            heading_text = (
-                heading_info.get("text")
-                if isinstance(heading_info, dict)
-                else heading_info
-            )
-            if heading_text in sort_config:
-                self.sort_manager.configure_column_sorting(
-                    treeview, col_id, sort_config[heading_text]
-                )
+
+class CustomersTableManager(BaseTableManager):
+    """Manages Customers table."""
+
+    _TITLE = "Clientes Cadastrados"
+
+    # Table columns (text -> displayed heading)
+    _COLDATA = (
+        {"text": "ID", "stretch": False, "width": 50},
+        {"text": "Nome", "stretch": True, "width": 150},
+        {"text": "Telefone", "stretch": True, "width": 120},
+        {"text": "Email", "stretch": True, "width": 150},
+        {"text": "CNPJ", "stretch": True, "width": 120},
+        {"text": "Endereço", "stretch": True, "width": 200},
+    )
+
+    # Heading text -> sorting function
+    _SORT_CONFIG = {
+        "ID": SortManager.sort_numeric,
+        "Nome": SortManager.sort_string,
+        "Telefone": SortManager.sort_phone,
+        "Email": SortManager.sort_string,
+        "CNPJ": SortManager.sort_cnpj,
+        "Endereço": SortManager.sort_string,
+    }
 
     def update_table_data(self, customers):
         """Updates customers table data."""
         try:
-            rowdata = []
-            for customer in customers:
-                customer = (
-                    tuple(list(customer) + [""] * (6 - len(customer)))
-                    if len(customer) < 6
-                    else customer
-                )
-
-                customer_id = customer[0]
-                name = customer[1] if len(customer) > 1 else "-"
-                phone = customer[2] if len(customer) > 2 else "-"
-                email = customer[3] if len(customer) > 3 else "-"
-                cnpj = customer[4] if len(customer) > 4 else "-"
-                address = customer[5] if len(customer) > 5 else "-"
-
-                rowdata.append(
-                    (
-                        customer_id,
-                        name or "-",
-                        phone or "-",
-                        email or "-",
-                        cnpj or "-",
-                        address or "-",
-                    )
+            # Short rows are padded with "" to 6 fields; generated lazily
+            rowdata = (
+                (
+                    customer_id,
+                    name or "-",
+                    phone or "-",
+                    email or "-",
+                    cnpj or "-",
+                    address or "-",
                 )
+                for customer_id, name, phone, email, cnpj, address
+                in ((tuple(customer) + _PAD)[:6] for customer in customers)
+            )
 
-            coldata = [
-                {"text": "ID", "stretch": False, "width": 50},
-                {"text": "Nome", "stretch": True, "width": 150},
-                {"text": "Telefone", "stretch": True, "width": 120},
-                {"text": "Email", "stretch": True, "width": 150},
-                {"text": "CNPJ", "stretch": True, "width": 120},
-                {"text": "Endereço", "stretch": True, "width": 200},
-            ]
-
-            if hasattr(self.table, "build_table_data"):
-                self.table.build_table_data(coldata, rowdata)
-                # reapply sorting after rebuild
-                self.configure_custom_sorting()
-            else:
-                for item in self.table.view.get_children():
-                    self.table.view.delete(item)
-                for row in rowdata:
-                    self.table.view.insert("", "end", values=row)
+            # Headings (and their sort commands) are left untouched
+            self._sync_rows(rowdata)
 
         except Exception as e:
             show_error(None, f"Erro ao atualizar tabela de clientes: {e}")
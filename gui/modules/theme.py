@@ -9,6 +9,46 @@ import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from ..keys import EventKeys
 
+# Instância de Style reaproveitada pela view (criada no primeiro uso)
+_STYLE = None
+
+
+def _style():
+    """Retorna o Style do ttkbootstrap, criando-o uma única vez"""
+    global _STYLE
+    if _STYLE is None:
+        _STYLE = tb.Style()
+    return _STYLE
+
+
+# Espera (ms) após a última seleção na árvore antes de aplicar o tema; ao
+# percorrer a lista com as setas só o tema final é aplicado
+_THEME_SELECT_DELAY_MS = 150
+
+# Botões de exemplo do preview: (bootstyle, texto)
+_SOLID_BUTTON_STYLES = tuple(
+    (style, style.capitalize())
+    for style in (PRIMARY, SECONDARY, SUCCESS, INFO, WARNING, DANGER)
+)
+_OUTLINE_BUTTON_STYLES = tuple(
+    (f"outline-{style}", style.capitalize())
+    for style in (PRIMARY, SECONDARY, SUCCESS, INFO, WARNING, DANGER)
+)
+
+# Cores principais mostradas na paleta do preview: (chave do estilo, rótulo)
+_MAIN_COLORS = (
+    ("primary", "Primária"),
+    ("secondary", "Secundária"),
+    ("success", "Sucesso"),
+    ("info", "Informação"),
+    ("warning", "Aviso"),
+    ("danger", "Perigo"),
+    ("light", "Clara"),
+    ("dark", "Escura"),
+)
+
+# Barras de progresso desenhadas no preview: (chave da cor, percentual)
+_PROGRESS_BARS = ((PRIMARY, 50), (SUCCESS, 75), (WARNING, 25))
 
 class ConfigTheme(tb.Frame):
     def __init__(self, parent, controller, theme_manager, database):
@@ -28,6 +68,25 @@ class ConfigTheme(tb.Frame):
         self.tree_frame = None
         self.preview_frame = None
         self.paned_window = None
+        # Nome do tema (minúsculo) -> item da árvore
+        self._theme_to_item = {}
+
+        # Cores da paleta por tema: {nome_do_tema: {chave_da_cor: cor}}
+        self._color_cache = {}
+        # Widgets do preview são criados uma vez; cada tema só recolore
+        # os quadrados da paleta: {chave_da_cor: (canvas, id do retângulo)}
+        self._preview_built = False
+        self._preview_built_for = None
+        self._swatches = {}
+        self._palette_canvas = None
+        self._progress_canvas = None
+        # Seções do preview ainda não criadas (criadas conforme a rolagem)
+        self._pending_sections = []
+        self._next_section_row = 0
+        self._section_after_id = None
+        self._scroll_after_id = None
+        # Aplicação de tema agendada por on_theme_select
+        self._select_after_id = None
 
         self.create_widgets()
 
@@ -163,8 +222,9 @@ class ConfigTheme(tb.Frame):
             content_container, orient=HORIZONTAL, command=self.preview_canvas.xview
         )
 
+        self._preview_vscroll = v_scrollbar
         self.preview_canvas.configure(
-            yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set
+            yscrollcommand=self._on_preview_yscroll, xscrollcommand=h_scrollbar.set
         )
 
         # Frame rolável
@@ -189,40 +249,39 @@ class ConfigTheme(tb.Frame):
         """Preenche a árvore com os temas organizados por categoria"""
         tree_data = self.theme_manager.get_themes_tree_data()
 
-        # Limpar árvore existente
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Limpar árvore existente (uma única chamada)
+        self.tree.delete(*self.tree.get_children())
+        self._theme_to_item = {}
 
-        # Adicionar categorias e temas
+        # Adicionar categorias (já expandidas) e temas
+        insert = self.tree.insert
         for category_name, themes in tree_data:
-            category_id = self.tree.insert(
-                "", "end", text=category_name, values=("Categoria",)
+            category_id = insert(
+                "", "end", text=category_name, values=("Categoria",), open=True
             )
 
-            for theme_name, theme_display in themes:
-                if "custom" in category_name.lower():
-                    theme_type = "Customizado"
-                elif "claro" in category_name.lower() or "light" in theme_name.lower():
-                    theme_type = "Claro"
-                else:
-                    theme_type = "Escuro"
-
-                self.tree.insert(
+            # Tipo já vem calculado pelo ThemeManager
+            for theme_name, theme_display, theme_type in themes:
+                item_id = insert(
                     category_id,
                     "end",
                     text=theme_display,
                     values=(theme_type,),
                     tags=(theme_name,),
                 )
-
-        # Expandir categorias
-        for category_id in self.tree.get_children():
-            self.tree.item(category_id, open=True)
+                # Índice nome -> item (o primeiro item de cada tema vale)
+                self._theme_to_item.setdefault(theme_name.lower(), item_id)
 
     def create_empty_preview(self):
         """Cria um preview vazio inicial"""
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
+        self._preview_built = False
+        self._preview_built_for = None
+        self._swatches = {}
+        self._palette_canvas = None
+        self._progress_canvas = None
+        self._pending_sections = []
 
         empty_label = tb.Label(
             self.scrollable_frame,
@@ -249,273 +308,302 @@ class ConfigTheme(tb.Frame):
 
         current_theme = self.theme_manager.current_theme
 
-        for category_id in self.tree.get_children():
-            for theme_id in self.tree.get_children(category_id):
-                tags = self.tree.item(theme_id, "tags")
-                if tags and len(tags) > 0:
-                    theme_name = tags[0]
-                    if theme_name.lower() == current_theme.lower():
-                        self.tree.selection_set(theme_id)
-                        self.tree.focus(theme_id)
-                        self.tree.see(theme_id)
-                        self.selected_theme_name = current_theme
-                        self.update_preview(current_theme)
-                        return
+        # Item localizado pelo índice montado em populate_theme_tree
+        theme_id = self._theme_to_item.get(current_theme.lower())
+        if theme_id is None:
+            # Fora do índice: uma única consulta ao Tk pelos itens com a tag do tema
+            matches = self.tree.tag_has(current_theme)
+            theme_id = matches[0] if matches else None
+        if theme_id is not None:
+            self.tree.selection_set(theme_id)
+            self.tree.focus(theme_id)
+            self.tree.see(theme_id)
+            self.selected_theme_name = current_theme
+            self.update_preview(current_theme)
 
     def update_preview(self, theme_name):
         """Atualiza a área de preview com elementos do tema selecionado"""
         if not hasattr(self, "scrollable_frame") or not self.scrollable_frame:
             return
 
-        # Limpar elementos anteriores
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        # Preview já mostra este tema
+        if self._preview_built and theme_name == self._preview_built_for:
+            return
+
+        if not self._preview_built:
+            self._build_preview_skeleton()
 
         # Atualizar título
         if hasattr(self, "preview_title") and self.preview_title:
             self.preview_title.config(text=f"Preview do Tema: {theme_name}")
 
+        self._refresh_preview(theme_name)
+        self._preview_built_for = theme_name
+
+        # Região de rolagem recalculada depois do layout, sem forçá-lo agora
+        if self._scroll_after_id is None:
+            self._scroll_after_id = self.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._scroll_after_id = None
+        self.preview_canvas.configure(scrollregion=self.preview_canvas.bbox("all"))
+
+    def _refresh_preview(self, theme_name):
+        """Recolore a paleta; os demais widgets seguem o tema aplicado sozinhos"""
+        theme_colors = self._get_theme_colors(theme_name)
+        for color_key, (color_canvas, rect_id) in self._swatches.items():
+            color_canvas.itemconfig(rect_id, fill=theme_colors[color_key])
+        if self._palette_canvas is not None:
+            # Rótulos desenhados no canvas não seguem o tema sozinhos
+            self._palette_canvas.itemconfig("rotulo", fill=theme_colors["fg"])
+        if self._progress_canvas is not None:
+            self._paint_progress_bars(theme_colors)
+
+    def _paint_progress_bars(self, theme_colors):
+        """Aplica as cores do tema às barras desenhadas no canvas"""
+        self._progress_canvas.itemconfig("trilho", fill=theme_colors["light"])
+        for color_key, _ in _PROGRESS_BARS:
+            self._progress_canvas.itemconfig(color_key, fill=theme_colors[color_key])
+
+    def _build_preview_skeleton(self):
+        """Cria uma única vez os elementos de exemplo do preview.
+
+        Só a paleta é criada agora; as demais seções ficam pendentes e são
+        criadas por _on_preview_yscroll quando a rolagem se aproxima do fim
+        do conteúdo (ou se ele já cabe inteiro na área visível).
+        """
+        # Remove o aviso do preview vazio
+        for widget in self.scrollable_frame.winfo_children():
+            widget.destroy()
+        self.scrollable_frame.grid_rowconfigure(0, weight=0)
+
         # Configurar grid do frame rolável
         self.scrollable_frame.grid_columnconfigure(0, weight=1)
 
-        current_row = 0
-
-        # 1. SEÇÃO DE CORES PRINCIPAIS
-        colors_frame = tb.Frame(
-            self.scrollable_frame, relief=GROOVE, borderwidth=1, padding=10
-        )
-        colors_frame.grid(row=current_row, column=0, sticky="ew", pady=5)
-        colors_frame.grid_columnconfigure(0, weight=1)
-        current_row += 1
-
-        tb.Label(
-            colors_frame, text="Paleta de Cores", font=("Helvetica", 10, "bold")
-        ).grid(row=0, column=0, sticky="w", pady=(0, 5))
-
-        # Cores principais em grid
-        main_colors = [
-            ("primary", "Primária"),
-            ("secondary", "Secundária"),
-            ("success", "Sucesso"),
-            ("info", "Informação"),
-            ("warning", "Aviso"),
-            ("danger", "Perigo"),
-            ("light", "Clara"),
-            ("dark", "Escura"),
+        self._build_palette_section(0)
+        self._pending_sections = [
+            self._build_buttons_section,
+            self._build_forms_section,
+            self._build_others_section,
         ]
+        self._next_section_row = 1
+
+        self._preview_built = True
 
-        color_grid = tb.Frame(colors_frame)
-        color_grid.grid(row=1, column=0, sticky="ew")
+    def _on_preview_yscroll(self, first, last):
+        """Repassa a rolagem à barra e agenda a próxima seção quando necessário"""
+        self._preview_vscroll.set(first, last)
+        if self._pending_sections and float(last) > 0.5:
+            if self._section_after_id is None:
+                self._section_after_id = self.after_idle(self._build_next_section)
 
-        for i in range(4):  # 4 colunas
-            color_grid.grid_columnconfigure(i, weight=1)
+    def _build_next_section(self):
+        """Cria a próxima seção pendente do preview"""
+        self._section_after_id = None
+        if not self._pending_sections:
+            return
+        builder = self._pending_sections.pop(0)
+        builder(self._next_section_row)
+        self._next_section_row += 1
+
+    def _build_palette_section(self, row):
+        """Seção com a paleta de cores do tema"""
+        colors_frame = tb.LabelFrame(
+            self.scrollable_frame, text="Paleta de Cores", padding=10
+        )
+        colors_frame.grid(row=row, column=0, sticky="ew", pady=5)
+        colors_frame.grid_columnconfigure(0, weight=1)
 
-        for i, (color_key, color_name) in enumerate(main_colors):
-            row = i // 4
-            col = i % 4
+        # Cores principais desenhadas num único canvas, 4 por linha
+        palette_canvas = tk.Canvas(
+            colors_frame, width=440, height=180, highlightthickness=0
+        )
+        palette_canvas.grid(row=0, column=0)
 
-            color_frame = tb.Frame(color_grid, width=100, height=80)
-            color_frame.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-            color_frame.grid_propagate(False)
-            color_frame.grid_columnconfigure(0, weight=1)
+        for i, (color_key, color_name) in enumerate(_MAIN_COLORS):
+            x = (i % 4) * 110 + 15
+            y = (i // 4) * 90 + 5
 
             # Quadrado de cor
-            color_canvas = tk.Canvas(
-                color_frame, width=80, height=40, highlightthickness=0
+            rect_id = palette_canvas.create_rectangle(
+                x, y, x + 80, y + 40, fill="#cccccc", outline="black", width=1
             )
-            color_canvas.grid(row=0, column=0, pady=5)
-
-            try:
-                style = tb.Style()
-                bg_color = (
-                    style.lookup(f"{color_key}.TButton", "background") or "#cccccc"
-                )
-            except:
-                bg_color = "#cccccc"
-
-            color_canvas.create_rectangle(
-                0, 0, 80, 40, fill=bg_color, outline="black", width=1
+            self._swatches[color_key] = (palette_canvas, rect_id)
+
+            # Rótulo
+            palette_canvas.create_text(
+                x + 40,
+                y + 55,
+                text=color_name,
+                font=("Helvetica", 8),
+                anchor="center",
+                tags=("rotulo",),
             )
+        self._palette_canvas = palette_canvas
 
-            # Label
-            tb.Label(
-                color_frame, text=color_name, font=("Helvetica", 8), anchor="center"
-            ).grid(row=1, column=0, sticky="ew", padx=5)
-
-        # 2. SEÇÃO DE BOTÕES
-        buttons_frame = tb.Frame(
-            self.scrollable_frame, relief=GROOVE, borderwidth=1, padding=10
-        )
-        buttons_frame.grid(row=current_row, column=0, sticky="ew", pady=5)
-        buttons_frame.grid_columnconfigure(0, weight=1)
-        current_row += 1
-
-        tb.Label(buttons_frame, text="Botões", font=("Helvetica", 10, "bold")).grid(
-            row=0, column=0, sticky="w", pady=(0, 5)
-        )
+    def _build_buttons_section(self, row):
+        """Seção com botões sólidos e outline"""
+        buttons_frame = tb.LabelFrame(self.scrollable_frame, text="Botões", padding=10)
+        buttons_frame.grid(row=row, column=0, sticky="ew", pady=5)
 
         # Botões sólidos
         tb.Label(buttons_frame, text="Sólidos:", font=("Helvetica", 9)).grid(
-            row=1, column=0, sticky="w", pady=(5, 2)
+            row=0,
+            column=0,
+            columnspan=len(_SOLID_BUTTON_STYLES),
+            sticky="w",
+            pady=(0, 2),
         )
-
-        solid_frame = tb.Frame(buttons_frame)
-        solid_frame.grid(row=2, column=0, sticky="w", pady=(0, 5))
-
-        for i, style in enumerate([PRIMARY, SECONDARY, SUCCESS, INFO, WARNING, DANGER]):
+        for i, (style, style_name) in enumerate(_SOLID_BUTTON_STYLES):
             tb.Button(
-                solid_frame, text=style.capitalize(), bootstyle=style, width=12
-            ).grid(row=0, column=i, padx=2)
+                buttons_frame, text=style_name, bootstyle=style, width=12
+            ).grid(row=1, column=i, padx=2, pady=(0, 5))
 
         # Botões outline
         tb.Label(buttons_frame, text="Outline:", font=("Helvetica", 9)).grid(
-            row=3, column=0, sticky="w", pady=(5, 2)
+            row=2,
+            column=0,
+            columnspan=len(_OUTLINE_BUTTON_STYLES),
+            sticky="w",
+            pady=(5, 2),
         )
+        for i, (style, style_name) in enumerate(_OUTLINE_BUTTON_STYLES):
+            tb.Button(
+                buttons_frame, text=style_name, bootstyle=style, width=12
+            ).grid(row=3, column=i, padx=2, pady=(0, 5))
 
-        outline_frame = tb.Frame(buttons_frame)
-        outline_frame.grid(row=4, column=0, sticky="w", pady=(0, 5))
-
-        outline_styles = [
-            "outline-primary",
-            "outline-secondary",
-            "outline-success",
-            "outline-info",
-            "outline-warning",
-            "outline-danger",
-        ]
-
-        for i, style in enumerate(outline_styles):
-            style_name = style.replace("outline-", "").capitalize()
-            tb.Button(outline_frame, text=style_name, bootstyle=style, width=12).grid(
-                row=0, column=i, padx=2
-            )
-
-        # 3. SEÇÃO DE FORMULÁRIOS
-        forms_frame = tb.Frame(
-            self.scrollable_frame, relief=GROOVE, borderwidth=1, padding=10
+    def _build_forms_section(self, row):
+        """Seção com campos, checkbuttons e radiobuttons"""
+        forms_frame = tb.LabelFrame(
+            self.scrollable_frame, text="Elementos de Formulário", padding=10
         )
-        forms_frame.grid(row=current_row, column=0, sticky="ew", pady=5)
-        forms_frame.grid_columnconfigure(0, weight=1)
-        current_row += 1
-
-        tb.Label(
-            forms_frame, text="Elementos de Formulário", font=("Helvetica", 10, "bold")
-        ).grid(row=0, column=0, sticky="w", pady=(0, 5))
+        forms_frame.grid(row=row, column=0, sticky="ew", pady=5)
 
         # Entradas de texto
-        entry_frame = tb.Frame(forms_frame)
-        entry_frame.grid(row=1, column=0, sticky="w", pady=2)
-
-        tb.Label(entry_frame, text="Campo de texto:").grid(row=0, column=0, sticky="w")
-        tb.Entry(entry_frame, width=20).grid(row=0, column=1, padx=5)
-        tb.Entry(entry_frame, width=20, bootstyle=SUCCESS).grid(row=0, column=2, padx=5)
-        tb.Entry(entry_frame, width=20, bootstyle=WARNING).grid(row=0, column=3, padx=5)
-
-        # Checkbuttons e Radiobuttons
-        check_radio_frame = tb.Frame(forms_frame)
-        check_radio_frame.grid(row=2, column=0, sticky="w", pady=5)
-        check_radio_frame.grid_columnconfigure(0, weight=1)
-        check_radio_frame.grid_columnconfigure(1, weight=1)
-
-        # Checkbuttons
-        check_frame = tb.Frame(check_radio_frame)
-        check_frame.grid(row=0, column=0, sticky="w", padx=10)
-
-        tb.Label(check_frame, text="Checkbuttons:", font=("Helvetica", 9)).grid(
-            row=0, column=0, sticky="w"
+        tb.Label(forms_frame, text="Campo de texto:").grid(row=0, column=0, sticky="w")
+        tb.Entry(forms_frame, width=20).grid(row=0, column=1, padx=5, pady=2)
+        tb.Entry(forms_frame, width=20, bootstyle=SUCCESS).grid(
+            row=0, column=2, padx=5, pady=2
+        )
+        tb.Entry(forms_frame, width=20, bootstyle=WARNING).grid(
+            row=0, column=3, padx=5, pady=2
+        )
+
+        # Checkbuttons (colunas 0-1) e Radiobuttons (colunas 2-3) lado a lado
+        tb.Label(forms_frame, text="Checkbuttons:", font=("Helvetica", 9)).grid(
+            row=1, column=0, columnspan=2, sticky="w", padx=10, pady=(5, 0)
         )
 
         self.check_var1 = tk.BooleanVar(value=True)
         self.check_var2 = tk.BooleanVar(value=False)
 
         tb.Checkbutton(
-            check_frame,
+            forms_frame,
             text="Selecionado",
             bootstyle="primary-toolbutton",
             variable=self.check_var1,
-        ).grid(row=1, column=0, sticky="w")
+        ).grid(row=2, column=0, columnspan=2, sticky="w", padx=10)
         tb.Checkbutton(
-            check_frame,
+            forms_frame,
             text="Deselecionado",
             bootstyle="primary-toolbutton",
             variable=self.check_var2,
-        ).grid(row=2, column=0, sticky="w")
+        ).grid(row=3, column=0, columnspan=2, sticky="w", padx=10)
         tb.Checkbutton(
-            check_frame,
+            forms_frame,
             text="Desabilitado",
             bootstyle="primary-toolbutton",
             state=DISABLED,
-        ).grid(row=3, column=0, sticky="w")
-
-        # Radiobuttons
-        radio_frame = tb.Frame(check_radio_frame)
-        radio_frame.grid(row=0, column=1, sticky="w", padx=10)
+        ).grid(row=4, column=0, columnspan=2, sticky="w", padx=10)
 
-        tb.Label(radio_frame, text="Radiobuttons:", font=("Helvetica", 9)).grid(
-            row=0, column=0, sticky="w"
+        tb.Label(forms_frame, text="Radiobuttons:", font=("Helvetica", 9)).grid(
+            row=1, column=2, columnspan=2, sticky="w", padx=10, pady=(5, 0)
         )
 
         self.radio_var = tk.StringVar(value="1")
         tb.Radiobutton(
-            radio_frame,
+            forms_frame,
             text="Opção 1",
             bootstyle="primary-toolbutton",
             variable=self.radio_var,
             value="1",
-        ).grid(row=1, column=0, sticky="w")
+        ).grid(row=2, column=2, columnspan=2, sticky="w", padx=10)
         tb.Radiobutton(
-            radio_frame,
+            forms_frame,
             text="Opção 2",
             bootstyle="primary-toolbutton",
             variable=self.radio_var,
             value="2",
-        ).grid(row=2, column=0, sticky="w")
+        ).grid(row=3, column=2, columnspan=2, sticky="w", padx=10)
         tb.Radiobutton(
-            radio_frame,
+            forms_frame,
             text="Desabilitado",
             bootstyle="primary-toolbutton",
             state=DISABLED,
-        ).grid(row=3, column=0, sticky="w")
+        ).grid(row=4, column=2, columnspan=2, sticky="w", padx=10)
 
-        # 4. SEÇÃO DE OUTROS ELEMENTOS
-        other_frame = tb.Frame(
-            self.scrollable_frame, relief=GROOVE, borderwidth=1, padding=10
+    def _build_others_section(self, row):
+        """Seção com barras de progresso e combobox"""
+        other_frame = tb.LabelFrame(
+            self.scrollable_frame, text="Outros Elementos", padding=10
         )
-        other_frame.grid(row=current_row, column=0, sticky="ew", pady=5)
-        other_frame.grid_columnconfigure(0, weight=1)
-        current_row += 1
-
-        tb.Label(
-            other_frame, text="Outros Elementos", font=("Helvetica", 10, "bold")
-        ).grid(row=0, column=0, sticky="w", pady=(0, 5))
+        other_frame.grid(row=row, column=0, sticky="ew", pady=5)
+        other_frame.grid_columnconfigure(1, weight=1)
 
         # Progressbar
         tb.Label(other_frame, text="Barras de progresso:").grid(
-            row=1, column=0, sticky="w"
+            row=0, column=0, columnspan=2, sticky="w"
         )
-        tb.Progressbar(other_frame, bootstyle=PRIMARY, value=50).grid(
-            row=2, column=0, sticky="ew", pady=1
-        )
-        tb.Progressbar(other_frame, bootstyle=SUCCESS, value=75).grid(
-            row=3, column=0, sticky="ew", pady=1
-        )
-        tb.Progressbar(other_frame, bootstyle=WARNING, value=25).grid(
-            row=4, column=0, sticky="ew", pady=1
+        # Apenas ilustrativas: desenhadas num canvas em vez de Progressbars reais
+        progress_canvas = tk.Canvas(
+            other_frame,
+            width=440,
+            height=len(_PROGRESS_BARS) * 16,
+            highlightthickness=0,
         )
+        progress_canvas.grid(row=1, column=0, columnspan=2, sticky="w", pady=1)
 
-        # Combobox
-        combo_frame = tb.Frame(other_frame)
-        combo_frame.grid(row=5, column=0, sticky="w", pady=5)
+        for i, (color_key, percent) in enumerate(_PROGRESS_BARS):
+            y = i * 16 + 3
+            progress_canvas.create_rectangle(
+                0, y, 440, y + 10, width=0, tags=("trilho",)
+            )
+            progress_canvas.create_rectangle(
+                0, y, 440 * percent // 100, y + 10, width=0, tags=(color_key,)
+            )
+        self._progress_canvas = progress_canvas
+        # A seção pode ser montada depois do preview já colorido
+        self._paint_progress_bars(self._get_theme_colors(self._preview_built_for))
 
-        tb.Label(combo_frame, text="Combobox:").grid(row=0, column=0, sticky="w")
+        # Combobox
+        tb.Label(other_frame, text="Combobox:").grid(
+            row=2, column=0, sticky="w", pady=5
+        )
         values = ["Opção 1", "Opção 2", "Opção 3"]
-        combo = tb.Combobox(combo_frame, values=values, width=15)
-        combo.grid(row=0, column=1, padx=5)
+        combo = tb.Combobox(other_frame, values=values, width=15)
+        combo.grid(row=2, column=1, sticky="w", padx=5, pady=5)
         combo.set("Opção 1")
 
-        # Atualizar canvas
-        self.scrollable_frame.update_idletasks()
-        self.preview_canvas.configure(scrollregion=self.preview_canvas.bbox("all"))
+    def _get_theme_colors(self, theme_name):
+        """Retorna as cores da paleta do tema, consultando o estilo uma só vez por tema"""
+        colors = self._color_cache.get(theme_name)
+        if colors is None:
+            colors = {}
+            try:
+                style = _style()
+                for color_key, _ in _MAIN_COLORS:
+                    colors[color_key] = (
+                        style.lookup(f"{color_key}.TButton", "background") or "#cccccc"
+                    )
+                colors["fg"] = style.lookup("TLabel", "foreground") or "black"
+            except tk.TclError:
+                # Consulta falhou: o que faltou fica com as cores neutras
+                pass
+            for color_key, _ in _MAIN_COLORS:
+                colors.setdefault(color_key, "#cccccc")
+            colors.setdefault("fg", "black")
+            self._color_cache[theme_name] = colors
+        return colors
 
     def on_theme_select(self, event):
         """Callback quando um tema é selecionado na árvore"""
@@ -525,12 +613,29 @@ class ConfigTheme(tb.Frame):
             tags = self.tree.item(item, "tags")
 
             if tags and len(tags) > 0:
-                theme_name = tags[0]
-                self.selected_theme_name = theme_name
+                # Reinicia a espera: só a última seleção é aplicada
+                self._cancel_pending_select()
+                self._select_after_id = self.after(
+                    _THEME_SELECT_DELAY_MS, self._commit_selection, tags[0]
+                )
 
-                success = self.apply_theme_automatically(theme_name)
-                if success:
-                    self.update_preview(theme_name)
+    def _commit_selection(self, theme_name):
+        """Aplica o tema selecionado e atualiza o preview"""
+        self._select_after_id = None
+        # Mesma linha selecionada de novo (ex.: ao sincronizar com o tema
+        # atual): tema e preview já estão aplicados
+        if theme_name == self.selected_theme_name and theme_name == self._preview_built_for:
+            return
+        self.selected_theme_name = theme_name
+
+        success = self.apply_theme_automatically(theme_name)
+        if success:
+            self.update_preview(theme_name)
+
+    def _cancel_pending_select(self):
+        if self._select_after_id is not None:
+            self.after_cancel(self._select_after_id)
+            self._select_after_id = None
 
     def apply_theme_automatically(self, theme_name):
         """Aplica o tema selecionado automaticamente"""
@@ -551,3 +656,13 @@ class ConfigTheme(tb.Frame):
     def go_back(self):
         """Volta para a view anterior"""
         self.controller.handle_event(EventKeys.BACK)
+
+    def destroy(self):
+        """Cancela a aplicação de tema e a seção pendentes antes de destruir a view"""
+        self._cancel_pending_select()
+        for after_id in (self._section_after_id, self._scroll_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._section_after_id = None
+        self._scroll_after_id = None
+        super().destroy()
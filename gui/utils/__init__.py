@@ -1,35 +1,51 @@
 # gui/utils/__init__.py
 """
 Módulo de utilitários para a interface gráfica com ttkbootstrap.
-Contém popups personalizados, tabelas customizadas, tooltips e utilitários de interface.
+Contém popups personalizados, explorador de arquivos, tooltips e utilitários de interface.
 
 Este arquivo expõe a API pública usada por outras partes da aplicação,
 por ex.: `from gui.utils import show_info, asksaveasfilename, create_info_tooltip`
 """
 
-# popups
-from .popups import (
-    CustomPopup,
-    show_info,
-    show_warning,
-    show_error,
-    ask_yes_no,
-    ask_ok_cancel,
-    ask_retry_cancel,
-)
-
-# file browser (explorador)
-from .file_browser import FileBrowser, askopenfilename, asksaveasfilename
-
-# tooltips
-from .tooltips import (
-    ToolTip,
-    create_default_tooltip,
-    create_warning_tooltip,
-    create_error_tooltip,
-    create_info_tooltip,
-    create_success_tooltip,
-)
+import importlib
+
+# Os submódulos são importados sob demanda (PEP 562): o primeiro acesso a um
+# nome importa o submódulo que o define e guarda o valor neste módulo
+_LAZY = {
+    # popups
+    "CustomPopup": "popups",
+    "show_info": "popups",
+    "show_warning": "popups",
+    "show_error": "popups",
+    "ask_yes_no": "popups",
+    "ask_ok_cancel": "popups",
+    "ask_retry_cancel": "popups",
+    # file browser (explorador)
+    "FileBrowser": "file_browser",
+    "askopenfilename": "file_browser",
+    "asksaveasfilename": "file_browser",
+    # tooltips
+    "ToolTip": "tooltips",
+    "create_default_tooltip": "tooltips",
+    "create_warning_tooltip": "tooltips",
+    "create_error_tooltip": "tooltips",
+    "create_info_tooltip": "tooltips",
+    "create_success_tooltip": "tooltips",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 # lista pública
 __all__ = [
@@ -40,10 +56,6 @@ __all__ = [
     "ask_yes_no",
     "ask_ok_cancel",
     "ask_retry_cancel",
-    "format_note_row",
-    "CustomTable",
-    "create_notes_table",
-    "create_notes_table_config",
     "FileBrowser",
     "askopenfilename",
     "asksaveasfilename",
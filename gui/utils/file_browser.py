@@ -11,7 +11,7 @@ import tkinter as tk
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 from PIL import Image, ImageTk
 
 # Adiciona o diretório raiz do projeto ao path para importações absolutas
@@ -293,6 +293,7 @@ class FileBrowser(tb.Toplevel):
         self.current_path = self.get_accessible_initial_path(initial_folder)
 
         self.file_types = file_types or [("Todos os arquivos", "*.*")]
+        self._compile_file_types()
         self.select_folder = select_folder
         self.select_multiple = select_multiple
         self.save_mode = save_mode
@@ -761,42 +762,61 @@ class FileBrowser(tb.Toplevel):
             self.current_path = path
             self.address_var.set(path)
 
-            for item in self.treeview.get_children():
-                self.treeview.delete(item)
-
-            items = os.listdir(path)
+            # Uma única varredura: tipo e metadados vêm do próprio DirEntry
             folders = []
             files = []
 
-            for item in items:
-                full_path = os.path.join(path, item)
-                if os.path.isdir(full_path):
-                    # Filtra pastas virtuais e links duplicados no Windows
-                    if not self.is_virtual_folder_duplicate(item, full_path):
-                        folders.append((item, full_path))
-                else:
-                    if self.filter_file(item):
-                        files.append((item, full_path))
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    item = entry.name
+                    full_path = entry.path
+                    try:
+                        is_folder = entry.is_dir()
+                    except OSError:
+                        is_folder = False
+
+                    if is_folder:
+                        # Filtra pastas virtuais e links duplicados no Windows
+                        if self.is_virtual_folder_duplicate(item, full_path):
+                            continue
+                    elif not self.filter_file(item):
+                        continue
+
+                    try:
+                        info = entry.stat()
+                    except OSError:
+                        info = None
+
+                    if is_folder:
+                        size = self.get_folder_size(full_path)
+                        modified = self.get_file_modified(info) if info else "?"
+                        folders.append((item, full_path, size, modified))
+                    else:
+                        size = self.get_file_size(info) if info else "?"
+                        modified = self.get_file_modified(info) if info else "?"
+                        files.append((item, full_path, size, modified))
 
             folders.sort(key=lambda x: x[0].lower())
             files.sort(key=lambda x: x[0].lower())
 
+            rows = [
+                (full_path, (name, size, modified))
+                for name, full_path, size, modified in folders + files
+            ]
             if path != os.path.dirname(path):
-                self.treeview.insert("", "end", iid="..", values=("..", "Pasta", ""))
-
-            for name, full_path in folders:
-                size = self.get_folder_size(full_path)
-                modified = self.get_file_modified(full_path)
-                self.treeview.insert(
-                    "", "end", iid=full_path, values=(name, size, modified)
-                )
-
-            for name, full_path in files:
-                size = self.get_file_size(full_path)
-                modified = self.get_file_modified(full_path)
-                self.treeview.insert(
-                    "", "end", iid=full_path, values=(name, size, modified)
-                )
+                rows.insert(0, ("..", ("..", "Pasta", "")))
+
+            # Colunas ocultas durante a troca: o Treeview só refaz o layout no fim
+            treeview = self.treeview
+            display_columns = treeview.cget("displaycolumns")
+            treeview.configure(displaycolumns=())
+            try:
+                treeview.delete(*treeview.get_children())
+                insert = treeview.insert
+                for iid, values in rows:
+                    insert("", "end", iid=iid, values=values)
+            finally:
+                treeview.configure(displaycolumns=display_columns)
 
             total_items = len(folders) + len(files)
             self.status_label.config(text=f"{total_items} itens")
@@ -880,34 +900,37 @@ class FileBrowser(tb.Toplevel):
                 return current
         return None
 
-    def filter_file(self, filename: str) -> bool:
-        """Filtra arquivos baseado nos tipos de arquivo especificados"""
-        if not self.file_types or any(ft[1] == "*.*" for ft in self.file_types):
-            return True
-
-        ext = os.path.splitext(filename)[1].lower()
+    def _compile_file_types(self):
+        """Converte os padrões de file_types num conjunto de extensões aceitas"""
+        self._allow_all = not self.file_types
+        self._allowed_exts = set()
         for desc, pattern in self.file_types:
-            if pattern == "*.*":
-                return True
-            patterns = pattern.lower().split(";")
-            for p in patterns:
+            for p in pattern.lower().split(";"):
                 p = p.strip()
-                if p == "*":
-                    return True
-                if p.startswith("*."):
-                    pattern_ext = p[2:]
-                    if ext == pattern_ext or (pattern_ext and ext == "." + pattern_ext):
-                        return True
-                if p.startswith(".") and ext == p:
-                    return True
-                if not p.startswith(".") and not p.startswith("*") and ext == "." + p:
-                    return True
-        return False
+                if p in ("*", "*.*"):
+                    self._allow_all = True
+                elif p.startswith("*."):
+                    # "*." aceita arquivos sem extensão
+                    self._allowed_exts.add("." + p[2:] if p[2:] else "")
+                elif p.startswith("."):
+                    self._allowed_exts.add(p)
+                elif p and not p.startswith("*"):
+                    self._allowed_exts.add("." + p)
+
+    def filter_file(self, filename: str) -> bool:
+        """Filtra arquivos baseado nos tipos de arquivo especificados"""
+        return (
+            self._allow_all
+            or os.path.splitext(filename)[1].lower() in self._allowed_exts
+        )
 
-    def get_file_size(self, filepath: str) -> str:
-        """Retorna o tamanho do arquivo formatado"""
+    def get_file_size(self, filepath: Union[str, os.stat_result]) -> str:
+        """Retorna o tamanho do arquivo formatado (aceita caminho ou stat já obtido)"""
         try:
-            size = os.path.getsize(filepath)
+            if isinstance(filepath, os.stat_result):
+                size = filepath.st_size
+            else:
+                size = os.path.getsize(filepath)
             if size < 1024:
                 return f"{size} B"
             elif size < 1024 * 1024:
@@ -923,10 +946,13 @@ class FileBrowser(tb.Toplevel):
         """Retorna o indicador de pasta"""
         return "Pasta"
 
-    def get_file_modified(self, filepath: str) -> str:
-        """Retorna a data de modificação formatada"""
+    def get_file_modified(self, filepath: Union[str, os.stat_result]) -> str:
+        """Retorna a data de modificação formatada (aceita caminho ou stat já obtido)"""
         try:
-            mtime = os.path.getmtime(filepath)
+            if isinstance(filepath, os.stat_result):
+                mtime = filepath.st_mtime
+            else:
+                mtime = os.path.getmtime(filepath)
             return datetime.fromtimestamp(mtime).strftime("%d/%m/%Y %H:%M")
         except:
             return "?"
@@ -984,20 +1010,20 @@ class FileBrowser(tb.Toplevel):
             self.load_directory(self.current_path)
             return
 
+        matches = []
         for item in self.treeview.get_children():
             values = self.treeview.item(item, "values")
             if values and search_term in str(values[0]).lower():
-                try:
-                    self.treeview.reattach(item, "", "end")
-                except Exception:
-                    pass
-                self.treeview.selection_set(item)
-                self.treeview.see(item)
-            else:
-                try:
-                    self.treeview.detach(item)
-                except Exception:
-                    pass
+                matches.append(item)
+
+        # Um único relink mantém as correspondências e desanexa o restante
+        try:
+            self.treeview.set_children("", *matches)
+        except Exception:
+            pass
+        if matches:
+            self.treeview.selection_set(matches[-1])
+            self.treeview.see(matches[-1])
 
     def go_back(self):
         """Navega para o diretório anterior no histórico"""